@@ -5,6 +5,25 @@ import json
 import sys
 from pathlib import Path
 
+# Color by status
+_COLOR_MAP = {
+    'pending': '#3498db',
+    'in_progress': '#f39c12',
+    'done': '#2ecc71',
+    'failed': '#e74c3c',
+    'deferred': '#95a5a6'
+}
+
+# Border by risk
+_BORDER_MAP = {
+    'low': '1',
+    'medium': '2',
+    'high': '3'
+}
+
+# Escape quotes, backslashes and newlines for quoted DOT strings
+_DOT_ESC = str.maketrans({'"': '\\"', '\\': '\\\\', '\n': '\\n'})
+
 def generate_dot(state_file: str, output_file: str):
     """Generate DOT file for dependency graph."""
 
@@ -13,64 +32,44 @@ def generate_dot(state_file: str, output_file: str):
 
     tasks = state.get('tasks', [])
 
-    # Start DOT file
-    dot = ['digraph Dependencies {']
-    dot.append('  rankdir=LR;')
-    dot.append('  node [shape=box, style=rounded];')
-    dot.append('')
-
-    # Define nodes with colors based on status and risk
-    for task in tasks:
-        task_id = task['id']
-        title = task['title'][:30] + '...' if len(task['title']) > 30 else task['title']
-        status = task.get('status', 'pending')
-        risk = task.get('risk_level', 'low')
-
-        # Color by status
-        color_map = {
-            'pending': '#3498db',
-            'in_progress': '#f39c12',
-            'done': '#2ecc71',
-            'failed': '#e74c3c',
-            'deferred': '#95a5a6'
-        }
-
-        # Border by risk
-        border_map = {
-            'low': '1',
-            'medium': '2',
-            'high': '3'
-        }
-
-        color = color_map.get(status, '#3498db')
-        border = border_map.get(risk, '1')
-
-        label = f"{task_id}\\n{title}"
-        dot.append(f'  "{task_id}" [label="{label}", fillcolor="{color}", style="filled,rounded", penwidth={border}];')
-
-    dot.append('')
-
-    # Define edges (dependencies)
-    for task in tasks:
-        task_id = task['id']
-        deps = task.get('dependencies', [])
-
-        for dep in deps:
-            dot.append(f'  "{dep}" -> "{task_id}";')
-
-    # Add suspended dependencies (dashed lines)
-    for task in tasks:
-        task_id = task['id']
-        suspended = task.get('suspended_dependencies', [])
-
-        for dep in suspended:
-            dot.append(f'  "{dep}" -> "{task_id}" [style=dashed, color=gray];')
-
-    dot.append('}')
-
-    # Write to file
-    with open(output_file, 'w') as f:
-        f.write('\n'.join(dot))
+    def lines():
+        # Start DOT file
+        yield 'digraph Dependencies {\n'
+        yield '  rankdir=LR;\n'
+        yield '  node [shape=box, style=rounded];\n'
+        yield '\n'
+
+        cmg = _COLOR_MAP.get
+        bmg = _BORDER_MAP.get
+        edge_lines = []
+        dashed_lines = []
+
+        # Define nodes with colors based on status and risk, collecting
+        # dependency edges in the same pass
+        for task in tasks:
+            task_id = task['id'].translate(_DOT_ESC)
+            t = task['title']
+            title = (t[:30] + '...' if len(t) > 30 else t).translate(_DOT_ESC)
+            color = cmg(task.get('status', 'pending'), '#3498db')
+            border = bmg(task.get('risk_level', 'low'), '1')
+
+            yield f'  "{task_id}" [label="{task_id}\\n{title}", fillcolor="{color}", style="filled,rounded", penwidth={border}];\n'
+
+            for dep in task.get('dependencies', []):
+                edge_lines.append(f'  "{dep.translate(_DOT_ESC)}" -> "{task_id}";\n')
+
+            # Suspended dependencies (dashed lines)
+            for dep in task.get('suspended_dependencies', []):
+                dashed_lines.append(f'  "{dep.translate(_DOT_ESC)}" -> "{task_id}" [style=dashed, color=gray];\n')
+
+        yield '\n'
+        yield from edge_lines
+        yield from dashed_lines
+        yield '}\n'
+
+    # Stream to file without building the whole DOT source in memory
+    with open(output_file, 'w', buffering=1 << 16) as f:
+        f.writelines(lines())
 
     print(f"Generated DOT file: {output_file}")
     print(f"To generate PNG: dot -Tpng {output_file} -o dependency_graph.png")
@@ -9,15 +9,62 @@ New unified FE ID system (2026-02-13):
   tasks_phase3.json   → FE-3xx
   tasks_phase4.json   → FE-4xx
   tasks_deferred.json → FE-D-*
+
+Writes compact JSON for the dashboard; pass --pretty for indented output,
+--force to rebuild even when the output is up to date, and --quiet to skip
+the summary report.
 """
 
 import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, obj, pretty: bool = False) -> None:
+    """Write obj as UTF-8 JSON (compact unless pretty) without a str copy."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        path.write_bytes(orjson.dumps(obj, option=option))
+        return
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if pretty:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return the mtime of path in ns, or 0 if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
 
-def load_tasks(file_path: Path) -> list[dict]:
-    """Load tasks from a JSON file, handling both formats."""
-    data = json.loads(file_path.read_text())
+def _is_pretty(path: Path) -> bool:
+    """Return True if the JSON at path was written indented."""
+    with open(path, "rb") as f:
+        return f.read(2) == b"{\n"
+
+
+def load_tasks(raw: bytes) -> list[dict]:
+    """Load tasks from raw JSON file contents, handling both formats."""
+    data = _loads(raw)
     if isinstance(data, list):
         return data
     # Extract tasks from any list-valued key
@@ -30,6 +77,9 @@ def load_tasks(file_path: Path) -> list[dict]:
 
 def main():
     base = Path(__file__).parent
+    force = "--force" in sys.argv[1:]
+    pretty = "--pretty" in sys.argv[1:]
+    quiet = "--quiet" in sys.argv[1:]
 
     # Task source files in order
     task_files = [
@@ -42,19 +92,43 @@ def main():
         "tasks_deferred.json",
     ]
 
+    # Skip the rebuild when the output is newer than every input and in the
+    # requested format; the directory's own mtime moves when a task file is
+    # deleted or renamed
+    out = base / "project_state.json"
+    meta_path = base / "project_state_meta.json"
+    paths = [base / fname for fname in task_files]
+    if not force:
+        out_mtime = _mtime_ns(out)
+        if (
+            out_mtime
+            and out_mtime >= max(map(_mtime_ns, [base, meta_path, *paths]))
+            and _is_pretty(out) == pretty
+        ):
+            print("✓ project_state.json is up to date (use --force to rebuild)")
+            return
+
+    def load(fpath):
+        try:
+            return load_tasks(fpath.read_bytes())
+        except FileNotFoundError:
+            return None
+
+    # Read and parse the files concurrently; map() preserves order
+    with ThreadPoolExecutor(max_workers=min(8, len(task_files))) as ex:
+        loaded = list(ex.map(load, paths))
+
     all_tasks = []
-    for fname in task_files:
-        fpath = base / fname
-        if fpath.exists():
-            tasks = load_tasks(fpath)
+    report = []
+    for fname, tasks in zip(task_files, loaded):
+        if tasks is not None:
             all_tasks.extend(tasks)
-            print(f"  {fname}: {len(tasks)} tasks")
+            report.append(f"  {fname}: {len(tasks)} tasks\n")
         else:
-            print(f"  {fname}: NOT FOUND, skipping")
+            report.append(f"  {fname}: NOT FOUND, skipping\n")
 
     # Load metadata
-    meta_path = base / "project_state_meta.json"
-    meta = json.loads(meta_path.read_text())
+    meta = _loads(meta_path.read_bytes())
 
     # Build project_state.json (flat format for dashboard)
     state = {
@@ -77,23 +151,26 @@ def main():
 
     # Update statistics
     stats = state["metadata"]["statistics"]
+    counts = Counter(t.get("status", "pending") for t in all_tasks)
     stats["total_tasks"] = len(all_tasks)
-    stats["active_tasks"] = sum(1 for t in all_tasks if t.get("status") != "deferred")
-    stats["deferred_tasks"] = sum(1 for t in all_tasks if t.get("status") == "deferred")
-    stats["in_review"] = sum(1 for t in all_tasks if t.get("status") == "in_review")
-    stats["in_progress"] = sum(1 for t in all_tasks if t.get("status") == "in_progress")
-    stats["done"] = sum(1 for t in all_tasks if t.get("status") == "done")
-    stats["pending"] = sum(1 for t in all_tasks if t.get("status") == "pending")
+    stats["active_tasks"] = len(all_tasks) - counts["deferred"]
+    stats["deferred_tasks"] = counts["deferred"]
+    stats["in_review"] = counts["in_review"]
+    stats["in_progress"] = counts["in_progress"]
+    stats["done"] = counts["done"]
+    stats["pending"] = counts["pending"]
 
     # Write output
-    out = base / "project_state.json"
-    out.write_text(json.dumps(state, ensure_ascii=False, indent=2))
+    _write_json(out, state, pretty=pretty)
 
-    print(f"\n✓ Built project_state.json: {len(all_tasks)} tasks")
-    print(f"  pending={stats['pending']}  in_review={stats['in_review']}  "
-          f"in_progress={stats['in_progress']}  done={stats['done']}  "
-          f"deferred={stats['deferred_tasks']}")
-    print(f"✓ Saved to {out}")
+    if quiet:
+        return
+    report.append(f"\n✓ Built project_state.json: {len(all_tasks)} tasks\n")
+    report.append(f"  pending={stats['pending']}  in_review={stats['in_review']}  "
+                  f"in_progress={stats['in_progress']}  done={stats['done']}  "
+                  f"deferred={stats['deferred_tasks']}\n")
+    report.append(f"✓ Saved to {out}\n")
+    sys.stdout.write("".join(report))
 
 
 if __name__ == "__main__":
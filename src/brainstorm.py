@@ -9,10 +9,19 @@ deferred tasks are later promoted.
 from __future__ import annotations
 
 import json
+import re
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from src.state import (
     BrainstormResult,
@@ -26,19 +35,137 @@ from src.state import (
 # -- Risk detection checks ---------------------------------------------------
 
 
+@dataclass
+class _TaskText:
+    """Lowercased text views of a task, computed once per risk scan."""
+    text: str
+    core: str
+    words: frozenset[str]
+    title_words: frozenset[str]
+    files: frozenset[str]
+
+
+def _task_text(task: Task) -> _TaskText:
+    """Build the lowercased text and token/file sets for a task."""
+    text = f"{task.title} {task.description}".lower()
+    # Title + first sentence of the description: the task's core intent
+    desc_core = task.description.split("。", 1)[0]
+    return _TaskText(
+        text=text,
+        core=f"{task.title} {desc_core}".lower(),
+        # Interned so equal tokens from different tasks share one object
+        # and set probes across tasks resolve on identity
+        words=frozenset(map(sys.intern, text.split())),
+        title_words=frozenset(map(sys.intern, task.title.lower().split())),
+        files=frozenset(task.files_to_touch),
+    )
+
+
+@dataclass
+class _PeerIndex:
+    """Inverted indexes over active peers for the redundancy check.
+
+    Only peers sharing a file or a title word with a task can be
+    redundant with it, so the check visits those instead of every task.
+    """
+    peers: list[Task]
+    by_file: dict[str, list[int]]
+    by_title_word: dict[str, list[int]]
+
+    def candidates(self, info: _TaskText) -> list[Task]:
+        """Return peers that could overlap with info, in task-list order."""
+        found: set[int] = set()
+        for f in info.files:
+            found.update(self.by_file.get(f, ()))
+        if len(info.title_words) >= 3:
+            for w in info.title_words:
+                found.update(self.by_title_word.get(w, ()))
+        return [self.peers[i] for i in sorted(found)]
+
+
+def _build_peer_index(
+    all_tasks: list[Task], texts: dict[str, _TaskText],
+) -> _PeerIndex:
+    """Index active (pending / in-progress) tasks by file and title word."""
+    peers: list[Task] = []
+    by_file: dict[str, list[int]] = {}
+    by_title_word: dict[str, list[int]] = {}
+    for t in all_tasks:
+        if t.status not in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS):
+            continue
+        i = len(peers)
+        peers.append(t)
+        info = _text_of(t, texts)
+        for f in info.files:
+            by_file.setdefault(f, []).append(i)
+        # Titles shorter than 3 words never take part in title overlap
+        if len(info.title_words) >= 3:
+            for w in info.title_words:
+                by_title_word.setdefault(w, []).append(i)
+    return _PeerIndex(peers, by_file, by_title_word)
+
+
+def _text_of(task: Task, texts: dict[str, _TaskText] | None) -> _TaskText:
+    """Look up a task's precomputed text views, building them if absent."""
+    if texts is not None:
+        info = texts.get(task.id)
+        if info is not None:
+            return info
+    return _task_text(task)
+
+
+@lru_cache(maxsize=64)
+def _keyword_matcher(
+    keywords: tuple[str, ...],
+) -> tuple[re.Pattern[str], tuple[tuple[str, str], ...]]:
+    """Prepare a keyword set once for matching against lowercased text.
+
+    Returns one compiled alternation plus (keyword, lowercased) pairs, so
+    neither the pattern nor the lowercased keywords are rebuilt per task.
+    """
+    pairs = tuple((kw, kw.lower()) for kw in keywords)
+    pattern = re.compile("|".join(re.escape(low) for _, low in pairs))
+    return pattern, pairs
+
+
+def _first_keyword(keywords: Sequence[str], text: str) -> str | None:
+    """Return the first keyword (in list order) found in lowercased text.
+
+    A single regex pass rules out the common no-match case; the ordered
+    scan only runs on a hit so the reported keyword stays stable.
+    """
+    pattern, pairs = _keyword_matcher(tuple(keywords))
+    if not pattern.search(text):
+        return None
+    return next(kw for kw, low in pairs if low in text)
+
+
+def _matched_keywords(keywords: Sequence[str], text: str) -> list[str]:
+    """Return all keywords (in list order) found in lowercased text."""
+    pattern, pairs = _keyword_matcher(tuple(keywords))
+    if not pattern.search(text):
+        return []
+    return [kw for kw, low in pairs if low in text]
+
+
+_EXTERNAL_DEPENDENCY_KEYWORDS = ("generate", "生成", "search", "optimize")
+_HIGH_UNCERTAINTY_KEYWORDS = ("research", "explore", "investigate", "试验", "调研")
+
+
 def _check_external_dependency(
     task: Task,
     all_tasks: list[Task],
     keywords: list[str] | None = None,
+    texts: dict[str, _TaskText] | None = None,
 ) -> str:
     """Flag tasks depending on external tools/data not under our control."""
     if task.type == TaskType.EXTERNAL_DEPENDENCY:
         return f"external_dependency: task type is EXTERNAL_DEPENDENCY"
-    kws = keywords or ["generate", "生成", "search", "optimize"]
-    text = f"{task.title} {task.description}".lower()
-    for kw in kws:
-        if kw.lower() in text:
-            return f"external_dependency: matches keyword '{kw}'"
+    kws = keywords or _EXTERNAL_DEPENDENCY_KEYWORDS
+    text = _text_of(task, texts).text
+    kw = _first_keyword(kws, text)
+    if kw is not None:
+        return f"external_dependency: matches keyword '{kw}'"
     return ""
 
 
@@ -46,13 +173,14 @@ def _check_high_uncertainty(
     task: Task,
     all_tasks: list[Task],
     keywords: list[str] | None = None,
+    texts: dict[str, _TaskText] | None = None,
 ) -> str:
     """Flag tasks where outcome is unpredictable."""
-    kws = keywords or ["research", "explore", "investigate", "试验", "调研"]
-    text = f"{task.title} {task.description}".lower()
-    for kw in kws:
-        if kw.lower() in text:
-            return f"high_uncertainty: matches keyword '{kw}'"
+    kws = keywords or _HIGH_UNCERTAINTY_KEYWORDS
+    text = _text_of(task, texts).text
+    kw = _first_keyword(kws, text)
+    if kw is not None:
+        return f"high_uncertainty: matches keyword '{kw}'"
     return ""
 
 
@@ -60,9 +188,13 @@ def _check_long_critical_path(
     task: Task,
     all_tasks: list[Task],
     threshold: int = 3,
+    dependents: Callable[[str], set[str]] | None = None,
 ) -> str:
     """Flag tasks that block >= threshold downstream tasks (transitive)."""
-    count = len(find_transitive_dependents(task.id, all_tasks))
+    if dependents is None:
+        count = len(find_transitive_dependents(task.id, all_tasks))
+    else:
+        count = len(dependents(task.id))
     if count >= threshold:
         return f"long_critical_path: blocks {count} downstream tasks"
     return ""
@@ -71,16 +203,17 @@ def _check_long_critical_path(
 # -- Critical review checks --------------------------------------------------
 
 
-_NOVELTY_GAP_KEYWORDS = [
+_NOVELTY_GAP_KEYWORDS = (
     "移植", "port", "迁移", "migrate", "追赶", "catch-up",
     "与vasp一致", "与qe一致", "parity", "porting",
-]
+)
 
 
 def _check_novelty_gap(
     task: Task,
     all_tasks: list[Task],
     keywords: list[str] | None = None,
+    texts: dict[str, _TaskText] | None = None,
 ) -> str:
     """Flag tasks that look like engineering catch-up but are labeled high priority.
 
@@ -91,9 +224,8 @@ def _check_novelty_gap(
     kws = keywords or _NOVELTY_GAP_KEYWORDS
     # Only scan title + first sentence of description (core intent),
     # not prerequisite/dependency context which may mention "迁移" etc.
-    desc_core = task.description.split("。")[0] if task.description else ""
-    text = f"{task.title} {desc_core}".lower()
-    matched = [kw for kw in kws if kw.lower() in text]
+    text = _text_of(task, texts).core
+    matched = _matched_keywords(kws, text)
     if not matched:
         return ""
     # Check if task is labeled as high-value despite being catch-up
@@ -107,29 +239,34 @@ def _check_redundant_with_peers(
     task: Task,
     all_tasks: list[Task],
     keywords: list[str] | None = None,
+    texts: dict[str, _TaskText] | None = None,
+    peer_index: _PeerIndex | None = None,
 ) -> str:
     """Flag tasks that overlap significantly with another task.
 
     Detects redundancy by comparing titles, descriptions, and files_to_touch.
     """
-    task_words = set(f"{task.title} {task.description}".lower().split())
-    task_files = set(task.files_to_touch)
+    info = _text_of(task, texts)
+    task_words = info.words
+    task_files = info.files
+    title_words_a = info.title_words
+    others = all_tasks if peer_index is None else peer_index.candidates(info)
 
-    for other in all_tasks:
+    for other in others:
         if other.id == task.id or other.status not in (
             TaskStatus.PENDING, TaskStatus.IN_PROGRESS,
         ):
             continue
+        other_info = _text_of(other, texts)
         # Check file overlap
-        if task_files and set(other.files_to_touch) & task_files:
-            other_words = set(
-                f"{other.title} {other.description}".lower().split(),
-            )
-            overlap = task_words & other_words
+        if task_files and not task_files.isdisjoint(other_info.files):
+            other_words = other_info.words
             # Require significant word overlap (>60% of smaller set)
             # to distinguish true redundancy from tasks that share files
             # but have different responsibilities (e.g. force vs stress).
+            # set & set already iterates the smaller operand.
             min_len = min(len(task_words), len(other_words))
+            overlap = task_words & other_words if min_len else frozenset()
             if min_len > 0 and len(overlap) / min_len > 0.6:
                 return (
                     f"redundant_with_peers: overlaps with {other.id} "
@@ -138,8 +275,7 @@ def _check_redundant_with_peers(
         # Check high title similarity (simple word overlap)
         # Use 80% threshold to avoid false positives on tasks sharing
         # a common module prefix (e.g. "DFT+U PW" family).
-        title_words_a = set(task.title.lower().split())
-        title_words_b = set(other.title.lower().split())
+        title_words_b = other_info.title_words
         if len(title_words_a) >= 3 and len(title_words_b) >= 3:
             title_overlap = title_words_a & title_words_b
             min_title = min(len(title_words_a), len(title_words_b))
@@ -151,16 +287,18 @@ def _check_redundant_with_peers(
     return ""
 
 
-_LOW_ROI_KEYWORDS = [
+_LOW_ROI_KEYWORDS = (
     "文档", "documentation", "docs", "自动化", "automation",
     "示例", "example", "tutorial",
-]
+)
 
 
 def _check_low_roi(
     task: Task,
     all_tasks: list[Task],
     keywords: list[str] | None = None,
+    dependents_map: dict[str, list[str]] | None = None,
+    texts: dict[str, _TaskText] | None = None,
 ) -> str:
     """Flag tasks with low return on investment.
 
@@ -168,42 +306,105 @@ def _check_low_roi(
     low-value keywords (documentation, automation, examples).
     """
     kws = keywords or _LOW_ROI_KEYWORDS
-    text = f"{task.title} {task.description}".lower()
-    matched = [kw for kw in kws if kw.lower() in text]
+    text = _text_of(task, texts).text
+    matched = _matched_keywords(kws, text)
     if not matched:
         return ""
-    # Check if task has no downstream dependents (leaf node)
-    dependents = find_transitive_dependents(task.id, all_tasks)
-    if len(dependents) > 0:
+    # Check if task has no downstream dependents (leaf node). Any
+    # transitive dependent implies a direct one, so no walk is needed.
+    if dependents_map is None:
+        has_downstream = any(task.id in t.dependencies for t in all_tasks)
+    else:
+        has_downstream = bool(dependents_map.get(task.id))
+    if has_downstream:
         return ""  # Has downstream impact, not low-ROI
     return f"low_roi: matches keywords {matched}, no downstream dependents"
 
 
+# Default check order is by cost: substring scans, then peer comparison,
+# then the transitive dependents walk.
+_CHECK_FUNCTIONS: dict[str, Callable[..., str]] = {
+    "external_dependency": _check_external_dependency,
+    "high_uncertainty": _check_high_uncertainty,
+    "novelty_gap": _check_novelty_gap,
+    "low_roi": _check_low_roi,
+    "redundant_with_peers": _check_redundant_with_peers,
+    "long_critical_path": _check_long_critical_path,
+}
+
+
 # -- Dependency graph helpers -------------------------------------------------
 
 
-def find_transitive_dependents(
-    task_id: str, all_tasks: list[Task],
-) -> set[str]:
-    """Find all tasks that transitively depend on task_id."""
+def _build_direct_dependents(all_tasks: list[Task]) -> dict[str, list[str]]:
+    """Build the reverse adjacency map: task id -> ids that depend on it."""
     direct_dependents: dict[str, list[str]] = {}
     for t in all_tasks:
         for dep in t.dependencies:
             direct_dependents.setdefault(dep, []).append(t.id)
+    return direct_dependents
 
-    result: set[str] = set()
-    stack = list(direct_dependents.get(task_id, []))
-    while stack:
-        tid = stack.pop()
-        if tid in result:
-            continue
-        result.add(tid)
-        stack.extend(direct_dependents.get(tid, []))
+
+def _walk_dependents(
+    task_id: str, direct_dependents: dict[str, list[str]],
+) -> set[str]:
+    """Collect every id reachable from task_id in the reverse adjacency map."""
+    result: set[str] = set(direct_dependents.get(task_id, ()))
+    # Ids are marked on enqueue, so each is queued at most once
+    queue = deque(result)
+    while queue:
+        for dep_id in direct_dependents.get(queue.popleft(), ()):
+            if dep_id not in result:
+                result.add(dep_id)
+                queue.append(dep_id)
     return result
 
 
+def find_transitive_dependents(
+    task_id: str,
+    all_tasks: list[Task],
+    *,
+    dependents_map: dict[str, list[str]] | None = None,
+) -> set[str]:
+    """Find all tasks that transitively depend on task_id.
+
+    Pass a prebuilt dependents_map (see _build_direct_dependents) to skip
+    rebuilding the reverse adjacency on repeated queries.
+    """
+    if dependents_map is None:
+        dependents_map = _build_direct_dependents(all_tasks)
+    return _walk_dependents(task_id, dependents_map)
+
+
+def _memoized_dependents(
+    all_tasks: list[Task],
+    dependents_map: dict[str, list[str]] | None = None,
+) -> Callable[[str], set[str]]:
+    """Return a cached transitive-dependents lookup over a fixed task list.
+
+    The reverse adjacency is built once and each task's dependents are
+    walked at most once, so repeated queries during a scan are cheap.
+    Only valid while the task graph is not mutated.
+    """
+    if dependents_map is None:
+        dependents_map = _build_direct_dependents(all_tasks)
+    cache: dict[str, set[str]] = {}
+
+    def lookup(task_id: str) -> set[str]:
+        result = cache.get(task_id)
+        if result is None:
+            result = cache[task_id] = _walk_dependents(task_id, dependents_map)
+        return result
+
+    return lookup
+
+
 def _find_transitive_deps_to_deferred(
-    task_id: str, all_tasks: list[Task],
+    task_id: str,
+    all_tasks: list[Task],
+    *,
+    dependents_map: dict[str, list[str]] | None = None,
+    task_map: dict[str, Task] | None = None,
 ) -> set[str]:
     """Find tasks that should be transitively deferred along with task_id.
 
@@ -212,11 +413,10 @@ def _find_transitive_deps_to_deferred(
     Simplified: tasks whose only dependents are the deferred task or
     other transitively-deferred tasks.
     """
-    task_map = {t.id: t for t in all_tasks}
-    dependents_of: dict[str, set[str]] = {}
-    for t in all_tasks:
-        for dep in t.dependencies:
-            dependents_of.setdefault(dep, set()).add(t.id)
+    if task_map is None:
+        task_map = {t.id: t for t in all_tasks}
+    if dependents_map is None:
+        dependents_map = _build_direct_dependents(all_tasks)
 
     # Walk backwards from task_id through its dependencies
     to_defer: set[str] = set()
@@ -229,8 +429,10 @@ def _find_transitive_deps_to_deferred(
         if dep_task is None:
             continue
         # Check if all dependents of this dep are either task_id or already deferred
-        dep_dependents = dependents_of.get(dep_id, set())
-        if dep_dependents and dep_dependents <= ({task_id} | to_defer):
+        dep_dependents = dependents_map.get(dep_id, ())
+        if dep_dependents and all(
+            d == task_id or d in to_defer for d in dep_dependents
+        ):
             to_defer.add(dep_id)
             stack.extend(dep_task.dependencies)
     return to_defer
@@ -243,18 +445,24 @@ def defer_task(
     state: ProjectState,
     task_id: str,
     trigger: str,
+    *,
+    task_map: dict[str, Task] | None = None,
 ) -> list[str]:
     """Defer a task and transitively defer its exclusive upstream chain.
 
-    Returns list of all deferred task IDs (including transitive).
+    Returns list of all deferred task IDs (including transitive), in
+    no particular order.
     """
-    task_map = {t.id: t for t in state.tasks}
+    if task_map is None:
+        task_map = {t.id: t for t in state.tasks}
     target = task_map.get(task_id)
     if target is None:
         return []
 
     # Find transitive tasks to defer
-    transitive = _find_transitive_deps_to_deferred(task_id, state.tasks)
+    transitive = _find_transitive_deps_to_deferred(
+        task_id, state.tasks, task_map=task_map,
+    )
     all_deferred = {task_id} | transitive
 
     # Set status and trigger
@@ -267,38 +475,38 @@ def defer_task(
     # Suspend dependencies in downstream tasks
     _suspend_deps_to_deferred(state, all_deferred)
 
-    return sorted(all_deferred)
+    return list(all_deferred)
 
 
 def restore_deferred_task(
     state: ProjectState,
     task_id: str,
+    *,
+    task_map: dict[str, Task] | None = None,
 ) -> list[str]:
     """Restore a deferred task and its transitive chain to PENDING.
 
-    Returns list of all restored task IDs.
+    Returns list of all restored task IDs, in no particular order.
     """
-    task_map = {t.id: t for t in state.tasks}
+    if task_map is None:
+        task_map = {t.id: t for t in state.tasks}
     target = task_map.get(task_id)
     if target is None or target.status != TaskStatus.DEFERRED:
         return []
 
     # Find all DEFERRED tasks that were part of this deferral chain
-    restored: set[str] = set()
-    stack = [task_id]
-    while stack:
-        tid = stack.pop()
-        if tid in restored:
-            continue
-        t = task_map.get(tid)
-        if t is None or t.status != TaskStatus.DEFERRED:
-            continue
-        restored.add(tid)
+    restored: set[str] = {task_id}
+    queue = deque([target])
+    while queue:
+        t = queue.popleft()
         # Also restore any DEFERRED tasks that this one depends on
         for dep in t.dependencies:
+            if dep in restored:
+                continue
             dep_task = task_map.get(dep)
             if dep_task and dep_task.status == TaskStatus.DEFERRED:
-                stack.append(dep)
+                restored.add(dep)
+                queue.append(dep_task)
 
     # Set status back to PENDING
     for tid in restored:
@@ -308,32 +516,49 @@ def restore_deferred_task(
     # Restore suspended dependencies
     _restore_suspended_deps(state, restored)
 
-    return sorted(restored)
+    return list(restored)
 
 
-def drop_task(state: ProjectState, task_id: str) -> None:
-    """Remove a task and clean up dangling dependencies."""
+def _remove_references(tasks: list[Task], task_id: str) -> None:
+    """Remove task_id from every dependency list of tasks, in place."""
+    for t in tasks:
+        for ids in (
+            t.dependencies, t.suspended_dependencies, t.original_dependencies,
+        ):
+            if task_id in ids:
+                ids[:] = [d for d in ids if d != task_id]
+
+
+def drop_task(
+    state: ProjectState,
+    task_id: str,
+    *,
+    task_map: dict[str, Task] | None = None,
+) -> None:
+    """Remove a task and clean up dangling dependencies.
+
+    A caller-supplied task_map is kept in sync with state.tasks.
+    """
     state.tasks = [t for t in state.tasks if t.id != task_id]
-    for t in state.tasks:
-        if task_id in t.dependencies:
-            t.dependencies.remove(task_id)
-        if task_id in t.suspended_dependencies:
-            t.suspended_dependencies.remove(task_id)
-        if task_id in t.original_dependencies:
-            t.original_dependencies.remove(task_id)
+    if task_map is not None:
+        task_map.pop(task_id, None)
+    _remove_references(state.tasks, task_id)
 
 
 def terminate_task(
     state: ProjectState,
     task_id: str,
     reason: str = "",
+    *,
+    task_map: dict[str, Task] | None = None,
 ) -> None:
     """Mark a task as terminated with audit trail, clean downstream refs.
 
     Unlike drop (which removes entirely), terminate preserves the task
     in state with a [TERMINATED] marker for traceability.
     """
-    task_map = {t.id: t for t in state.tasks}
+    if task_map is None:
+        task_map = {t.id: t for t in state.tasks}
     target = task_map.get(task_id)
     if target is None:
         return
@@ -348,15 +573,7 @@ def terminate_task(
     # Clear outgoing blocks (terminated tasks don't block anything)
     # blocks is a JSON-level field, not on the Task dataclass, so we
     # just clean downstream dependency references.
-    for t in state.tasks:
-        if t.id == task_id:
-            continue
-        if task_id in t.dependencies:
-            t.dependencies.remove(task_id)
-        if task_id in t.suspended_dependencies:
-            t.suspended_dependencies.remove(task_id)
-        if task_id in t.original_dependencies:
-            t.original_dependencies.remove(task_id)
+    _remove_references([t for t in state.tasks if t.id != task_id], task_id)
 
 
 def split_task(
@@ -367,14 +584,21 @@ def split_task(
     deferred_title: str,
     deferred_description: str,
     defer_trigger: str,
+    *,
+    task_map: dict[str, Task] | None = None,
 ) -> tuple[str, str]:
     """Replace a task with a safe part and a deferred part.
 
-    Returns (safe_task_id, deferred_task_id).
+    Returns (safe_task_id, deferred_task_id). A caller-supplied task_map
+    is kept in sync with state.tasks.
     """
-    task_map = {t.id: t for t in state.tasks}
-    original = task_map.get(task_id)
-    if original is None:
+    if task_map is not None and task_id not in task_map:
+        return ("", "")
+    # Locate the task and its position in one pass
+    for idx, original in enumerate(state.tasks):
+        if original.id == task_id:
+            break
+    else:
         return ("", "")
 
     safe_id = f"{task_id}-safe"
@@ -412,15 +636,21 @@ def split_task(
     )
 
     # Replace original with safe + deferred
-    idx = next(i for i, t in enumerate(state.tasks) if t.id == task_id)
     state.tasks[idx:idx + 1] = [safe_task, deferred_task]
+    if task_map is not None:
+        del task_map[task_id]
+        task_map[safe_id] = safe_task
+        task_map[deferred_id] = deferred_task
 
     # Rewire downstream: replace old task_id dep with safe_id
     for t in state.tasks:
-        if task_id in t.dependencies:
-            t.dependencies = [
-                safe_id if d == task_id else d for d in t.dependencies
-            ]
+        deps = t.dependencies
+        if task_id not in deps:
+            continue
+        if deps.count(task_id) == 1:
+            deps[deps.index(task_id)] = safe_id
+        else:
+            deps[:] = [safe_id if d == task_id else d for d in deps]
 
     return (safe_id, deferred_id)
 
@@ -437,9 +667,9 @@ def _suspend_deps_to_deferred(
             continue
         if t.status == TaskStatus.DONE:
             continue
-        to_suspend = [d for d in t.dependencies if d in deferred_ids]
-        if not to_suspend:
+        if deferred_ids.isdisjoint(t.dependencies):
             continue
+        to_suspend = [d for d in t.dependencies if d in deferred_ids]
         # Snapshot original deps if not already saved
         if not t.original_dependencies:
             t.original_dependencies = list(t.dependencies)
@@ -454,9 +684,9 @@ def _restore_suspended_deps(
     for t in state.tasks:
         if t.status == TaskStatus.DONE:
             continue
-        to_restore = [d for d in t.suspended_dependencies if d in restored_ids]
-        if not to_restore:
+        if restored_ids.isdisjoint(t.suspended_dependencies):
             continue
+        to_restore = [d for d in t.suspended_dependencies if d in restored_ids]
         t.dependencies.extend(to_restore)
         t.suspended_dependencies = [
             d for d in t.suspended_dependencies if d not in restored_ids
@@ -484,42 +714,50 @@ def flag_risky_tasks(
     checks: list[str] | None = None,
     keywords: list[str] | None = None,
     threshold: int = 3,
+    first_match_only: bool = False,
 ) -> list[BrainstormQuestion]:
-    """Scan tasks and generate brainstorm questions for flagged ones."""
-    check_map: dict[str, Callable] = {
-        "external_dependency": lambda t, ts: _check_external_dependency(
-            t, ts, keywords,
-        ),
-        "high_uncertainty": lambda t, ts: _check_high_uncertainty(
-            t, ts, keywords,
-        ),
-        "long_critical_path": lambda t, ts: _check_long_critical_path(
-            t, ts, threshold,
-        ),
-        "novelty_gap": lambda t, ts: _check_novelty_gap(t, ts, keywords),
-        "redundant_with_peers": lambda t, ts: _check_redundant_with_peers(
-            t, ts, keywords,
-        ),
-        "low_roi": lambda t, ts: _check_low_roi(t, ts, keywords),
-    }
-    active_checks = checks or list(check_map.keys())
-    questions: list[BrainstormQuestion] = []
+    """Scan tasks and generate brainstorm questions for flagged ones.
 
-    for task in state.tasks:
-        if task.status != TaskStatus.PENDING:
+    Checks run in the order given; the default order is cheapest first so
+    that ``first_match_only`` can skip the graph traversals for tasks an
+    earlier keyword check already flagged.
+    """
+    # Shared by the graph-based checks and blocks_count below
+    dependents_map = _build_direct_dependents(state.tasks)
+    dependents = _memoized_dependents(state.tasks, dependents_map)
+    # Lowercased text and token sets, built once instead of per check/pair
+    texts = {t.id: _task_text(t) for t in state.tasks}
+    peer_index = _build_peer_index(state.tasks, texts)
+    # Resolve each active check and its keyword arguments once per scan
+    active: list[tuple[Callable[..., str], dict[str, Any]]] = []
+    for check_name in checks or _CHECK_FUNCTIONS:
+        fn = _CHECK_FUNCTIONS.get(check_name)
+        if fn is None:
             continue
+        if check_name == "long_critical_path":
+            kwargs = {"threshold": threshold, "dependents": dependents}
+        else:
+            kwargs = {"keywords": keywords, "texts": texts}
+            if check_name == "redundant_with_peers":
+                kwargs["peer_index"] = peer_index
+            elif check_name == "low_roi":
+                kwargs["dependents_map"] = dependents_map
+        active.append((fn, kwargs))
+    questions: list[BrainstormQuestion] = []
+
+    pending = [t for t in state.tasks if t.status == TaskStatus.PENDING]
+    for task in pending:
         reasons: list[str] = []
-        for check_name in active_checks:
-            fn = check_map.get(check_name)
-            if fn is None:
-                continue
-            reason = fn(task, state.tasks)
+        for fn, kwargs in active:
+            reason = fn(task, state.tasks, **kwargs)
             if reason:
                 reasons.append(reason)
+                if first_match_only:
+                    break
         if not reasons:
             continue
 
-        blocks_count = len(find_transitive_dependents(task.id, state.tasks))
+        blocks_count = len(dependents(task.id))
         questions.append(BrainstormQuestion(
             task_id=task.id,
             title=task.title,
@@ -568,7 +806,11 @@ def generate_brainstorm_prompt(
     }
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(prompt, indent=2, ensure_ascii=False))
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(prompt, option=orjson.OPT_INDENT_2))
+    else:
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(prompt, f, indent=2, ensure_ascii=False)
     return str(path)
 
 
@@ -582,7 +824,8 @@ def read_brainstorm_response(
     path = Path(file_path)
     if not path.exists():
         return None
-    data = json.loads(path.read_text())
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     if data.get("status") != "resolved":
         return None
     return data.get("decisions", [])
@@ -599,6 +842,8 @@ def apply_brainstorm_decisions(
     """Apply brainstorm decisions to the task list. Returns audit trail."""
     results: list[BrainstormResult] = []
     ts = time.strftime("%Y-%m-%dT%H:%M:%S")
+    # Shared by every helper; split/drop keep it in sync with state.tasks
+    task_map = {t.id: t for t in state.tasks}
 
     for dec in decisions:
         task_id = dec["task_id"]
@@ -607,8 +852,8 @@ def apply_brainstorm_decisions(
         notes = dec.get("notes", "")
 
         if action == "defer":
-            deferred = defer_task(state, task_id, trigger)
-            action_desc = f"deferred {len(deferred)} tasks: {deferred}"
+            deferred = defer_task(state, task_id, trigger, task_map=task_map)
+            action_desc = f"deferred {len(deferred)} tasks: {sorted(deferred)}"
         elif action == "keep":
             action_desc = "kept as-is"
         elif action == "split":
@@ -619,13 +864,14 @@ def apply_brainstorm_decisions(
                 deferred_title=dec.get("deferred_title", f"{task_id} (deferred)"),
                 deferred_description=dec.get("deferred_description", ""),
                 defer_trigger=trigger,
+                task_map=task_map,
             )
             action_desc = f"split into {safe_id} + {def_id}"
         elif action == "drop":
-            drop_task(state, task_id)
+            drop_task(state, task_id, task_map=task_map)
             action_desc = "dropped"
         elif action == "terminate":
-            terminate_task(state, task_id, reason=notes)
+            terminate_task(state, task_id, reason=notes, task_map=task_map)
             action_desc = f"terminated: {notes}"
         else:
             action_desc = f"unknown action: {action}"
@@ -699,54 +945,126 @@ def run_brainstorm_interactive(
 # -- Deferred trigger checking ------------------------------------------------
 
 
+@dataclass
+class DeferralIndex:
+    """Deferred tasks bucketed by the task ID their trigger names.
+
+    Built once per execution run so each completion only looks at the
+    tasks whose trigger can fire on it. Reflects deferrals at build time;
+    rebuild after applying new brainstorm decisions.
+    """
+
+    task_map: dict[str, Task]
+    by_trigger: dict[str, list[Task]]
+
+    @classmethod
+    def build(cls, state: ProjectState) -> DeferralIndex:
+        by_trigger: dict[str, list[Task]] = {}
+        for t in state.tasks:
+            if t.status != TaskStatus.DEFERRED:
+                continue
+            parsed = _parse_trigger(t.defer_trigger)
+            if parsed is not None:
+                by_trigger.setdefault(parsed[0], []).append(t)
+        return cls({t.id: t for t in state.tasks}, by_trigger)
+
+    def discard(self, task_ids: list[str]) -> None:
+        """Drop restored tasks from their buckets."""
+        gone = set(task_ids)
+        for key, bucket in list(self.by_trigger.items()):
+            kept = [t for t in bucket if t.id not in gone]
+            if kept:
+                self.by_trigger[key] = kept
+            else:
+                del self.by_trigger[key]
+
+
 def check_deferred_triggers(
     state: ProjectState,
     completed_task_id: str,
+    *,
+    index: DeferralIndex | None = None,
 ) -> list[str]:
     """Check if completing a task should promote any deferred tasks.
 
-    Returns list of promoted task IDs.
+    Returns the sorted list of promoted task IDs.
     """
+    if index is None:
+        index = DeferralIndex.build(state)
+    bucket = index.by_trigger.get(completed_task_id)
+    if not bucket:
+        return []
+    failed_gates = _failed_gate_task_ids(state)
     promoted: list[str] = []
-    for task in state.tasks:
+    for task in bucket:
         if task.status != TaskStatus.DEFERRED:
             continue
-        if not task.defer_trigger:
-            continue
-        if _trigger_matches(task.defer_trigger, completed_task_id, state):
-            restored = restore_deferred_task(state, task.id)
+        if _trigger_matches(
+            task.defer_trigger, completed_task_id, state,
+            task_map=index.task_map, failed_gates=failed_gates,
+        ):
+            restored = restore_deferred_task(
+                state, task.id, task_map=index.task_map,
+            )
             promoted.extend(restored)
+    if promoted:
+        index.discard(promoted)
+        promoted.sort()
     return promoted
 
 
+@lru_cache(maxsize=256)
+def _parse_trigger(trigger: str) -> tuple[str, str] | None:
+    """Split "TASK-ID:condition" into its parts, or None if malformed."""
+    if ":" not in trigger:
+        return None
+    trigger_task_id, condition = trigger.split(":", 1)
+    return trigger_task_id, condition
+
+
+def _failed_gate_task_ids(state: ProjectState) -> set[str]:
+    """Task IDs with at least one failing gate result.
+
+    Gate result keys have the form "TASK-ID:gate_type".
+    """
+    return {
+        key.split(":", 1)[0]
+        for key, result in state.gate_results.items()
+        if ":" in key and result.status.value == "fail"
+    }
+
+
 def _trigger_matches(
     trigger: str,
     completed_task_id: str,
     state: ProjectState,
+    *,
+    task_map: dict[str, Task] | None = None,
+    failed_gates: set[str] | None = None,
 ) -> bool:
     """Check if a trigger condition is met.
 
     Trigger format: "TASK-ID:condition" or "TASK-ID:promoted"
     Simple matching: trigger starts with the completed task ID.
     """
-    if ":" not in trigger:
+    parsed = _parse_trigger(trigger)
+    if parsed is None:
         return False
-    trigger_task_id, condition = trigger.split(":", 1)
+    trigger_task_id, condition = parsed
     if trigger_task_id != completed_task_id:
         return False
+    if task_map is None:
+        task_map = {t.id: t for t in state.tasks}
     # "promoted" means the trigger task was itself restored from deferred
     if condition == "promoted":
-        task_map = {t.id: t for t in state.tasks}
         t = task_map.get(trigger_task_id)
         return t is not None and t.status == TaskStatus.PENDING
     # For other conditions (e.g. "accuracy<0.99"), check gate results
-    # The gate result key format is "TASK-ID:gate_type"
-    for key, result in state.gate_results.items():
-        if key.startswith(f"{trigger_task_id}:"):
-            if result.status.value == "fail":
-                return True
+    if failed_gates is None:
+        failed_gates = _failed_gate_task_ids(state)
+    if trigger_task_id in failed_gates:
+        return True
     # Also trigger if the task simply completed (any completion = trigger)
-    task_map = {t.id: t for t in state.tasks}
     t = task_map.get(trigger_task_id)
     return t is not None and t.status == TaskStatus.DONE
 
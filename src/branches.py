@@ -6,13 +6,80 @@ When a branch is merged, its target_capabilities are added to capabilities.yaml.
 
 from __future__ import annotations
 
+import json
+import os
+import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import IO, Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+# Strings that load back unchanged as plain YAML scalars
+_PLAIN_SCALAR = re.compile(r"[A-Za-z_/][\w./ -]*(?<! )")
+# Plain words YAML 1.1 would resolve to booleans or null
+_RESERVED_WORDS = frozenset({
+    "y", "n", "yes", "no", "true", "false", "on", "off", "null",
+})
+
+# abspath -> ((mtime_ns, size), parsed YAML); entries are rebuilt per load
+# so registries never share mutable state through the cache
+_BRANCHES_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _q(value: Any) -> str:
+    """Render a loaded value as an inline YAML node, quoting strings only when needed.
+
+    JSON string syntax is a subset of YAML double-quoted scalars, so
+    json.dumps covers every escape a quoted value can need. Non-string
+    values (hand-edited files may hold nulls, numbers or booleans) are
+    written back the way yaml.dump would.
+    """
+    if isinstance(value, str):
+        if _PLAIN_SCALAR.fullmatch(value) and value.lower() not in _RESERVED_WORDS:
+            return value
+        return json.dumps(value)
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    # Floats, dates, nested nodes: rare enough to leave to PyYAML
+    text = yaml.dump(
+        value, Dumper=SafeDumper, default_flow_style=True, width=1 << 30,
+    )
+    return text.removesuffix("\n...\n").rstrip("\n")
+
+
+def _dump_branches(branches: dict[str, list[BranchEntry]], fp: IO[str]) -> None:
+    """Write the registry in block style, as yaml.dump would lay it out."""
+    write = fp.write
+    for comp, entries in branches.items():
+        if not entries:
+            write(f"{_q(comp)}: []\n")
+            continue
+        write(f"{_q(comp)}:\n")
+        for e in entries:
+            write(f"- branch: {_q(e.branch)}\n  repo: {_q(e.repo)}\n")
+            if e.target_capabilities:
+                write("  target_capabilities:\n")
+                for cap in e.target_capabilities:
+                    write(f"  - {_q(cap)}\n")
+            else:
+                write("  target_capabilities: []\n")
+            write(
+                f"  created_by: {_q(e.created_by)}\n"
+                f"  task_id: {_q(e.task_id)}\n"
+                f"  status: {_q(e.status)}\n"
+            )
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BranchEntry:
     """A single in-development branch."""
 
@@ -38,28 +105,52 @@ class BranchEntry:
         return cls(
             branch=data["branch"],
             repo=data["repo"],
-            target_capabilities=data["target_capabilities"],
+            target_capabilities=list(data["target_capabilities"]),
             created_by=data["created_by"],
             task_id=data["task_id"],
             status=data.get("status", "in_progress"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BranchRegistry:
-    """Registry of in-development branches per component."""
+    """Registry of in-development branches per component.
+
+    Change ``branches`` only through register_branch and merge_branch:
+    has_in_progress answers from an index those two methods reset, so
+    edits made directly on the dict, its lists, or an entry's
+    target_capabilities are not seen by it.
+    """
 
     branches: dict[str, list[BranchEntry]] = field(default_factory=dict)
     _path: str | None = None
+    # Lowercased capabilities of active branches, each prefixed with "\0";
+    # rebuilt lazily after register_branch / merge_branch
+    _active_caps: str | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     @classmethod
     def load(cls, path: str = "branches.yaml") -> BranchRegistry:
-        """Load branch registry from YAML file."""
+        """Load branch registry from YAML file.
+
+        The parsed file is cached per process and reused until its
+        mtime or size changes.
+        """
+        key = os.path.abspath(path)
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
+            st = os.stat(path)
         except FileNotFoundError:
-            data = {}
+            _BRANCHES_CACHE.pop(key, None)
+            return cls(branches={}, _path=path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _BRANCHES_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            data = cached[1]
+        else:
+            with open(path) as f:
+                data = yaml.load(f, Loader=SafeLoader) or {}
+            _BRANCHES_CACHE[key] = (stamp, data)
         branches = {}
         for comp, entries in data.items():
             if isinstance(entries, list):
@@ -69,15 +160,12 @@ class BranchRegistry:
     def save(self, path: str | None = None) -> None:
         """Save branch registry to YAML file."""
         path = path or self._path or "branches.yaml"
-        data = {}
-        for comp, entries in self.branches.items():
-            data[comp] = [e.to_dict() for e in entries]
         with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            _dump_branches(self.branches, f)
 
     def get_branches(self, component: str) -> list[BranchEntry]:
-        """Get all branches for a component."""
-        return self.branches.get(component, [])
+        """Get all branches for a component (a copy of the registry's list)."""
+        return list(self.branches.get(component, ()))
 
     def get_in_progress(self, component: str) -> list[BranchEntry]:
         """Get only active (non-merged) branches for a component."""
@@ -88,19 +176,24 @@ class BranchRegistry:
 
     def has_in_progress(self, capability_keyword: str) -> bool:
         """Check if any active branch targets a capability matching the keyword."""
-        keyword_lower = capability_keyword.lower()
-        for entries in self.branches.values():
-            for entry in entries:
-                if entry.status in ("in_progress", "ready_to_merge"):
-                    if any(keyword_lower in cap.lower() for cap in entry.target_capabilities):
-                        return True
-        return False
+        if self._active_caps is None:
+            self._active_caps = "".join(
+                "\0" + cap.lower()
+                for entries in self.branches.values()
+                for entry in entries
+                if entry.status in ("in_progress", "ready_to_merge")
+                for cap in entry.target_capabilities
+            )
+        # One substring test over all capabilities; the separator keeps a
+        # keyword from matching across two of them
+        return bool(self._active_caps) and capability_keyword.lower() in self._active_caps
 
     def register_branch(self, component: str, entry: BranchEntry) -> None:
         """Register a new branch for a component."""
         if component not in self.branches:
             self.branches[component] = []
         self.branches[component].append(entry)
+        self._active_caps = None
 
     def merge_branch(
         self,
@@ -113,16 +206,17 @@ class BranchRegistry:
         Returns the list of target_capabilities that should be added to capabilities.yaml.
         The caller is responsible for updating capabilities.yaml.
         """
-        entries = self.branches.get(component, [])
-        target_caps: list[str] = []
-        remaining = []
-        for entry in entries:
+        entries = self.branches.get(component)
+        if not entries:
+            self.branches.pop(component, None)
+            return []
+        for i, entry in enumerate(entries):
             if entry.branch == branch_name:
-                target_caps = entry.target_capabilities
-            else:
-                remaining.append(entry)
-        if remaining:
-            self.branches[component] = remaining
-        elif component in self.branches:
+                del entries[i]
+                break
+        else:
+            return []
+        if not entries:
             del self.branches[component]
-        return target_caps
+        self._active_caps = None
+        return entry.target_capabilities
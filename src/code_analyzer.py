@@ -8,117 +8,283 @@ from __future__ import annotations
 
 import ast
 import fnmatch
+import mmap
 import os
 import re
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
+# Statement-list fields that can (transitively) hold a class definition
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+# Below this many files a process pool costs more than it saves
+_PARALLEL_MIN_FILES = 50
+
+# Tool and cache directories never holding sources worth analyzing
+_SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", ".venv", "node_modules",
+    ".tox", ".mypy_cache", ".pytest_cache",
+})
+
+
+def _iter_class_defs(tree: ast.AST) -> Iterator[ast.ClassDef]:
+    """Yield class definitions at any nesting depth, breadth-first.
+
+    Only statement blocks are visited: a class definition is a statement,
+    so the expression subtrees ast.walk would also descend into are skipped.
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        for name in _BLOCK_FIELDS:
+            for child in getattr(node, name, ()):
+                if isinstance(child, ast.ClassDef):
+                    yield child
+                queue.append(child)
+
+
+def _file_matches(filepath: str, pattern: re.Pattern[bytes]) -> bool:
+    """Search a file's bytes through mmap, without reading it into memory."""
+    with open(filepath, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pattern.search(mm) is not None
+        except ValueError:  # empty files cannot be mapped
+            return pattern.search(b"") is not None
+
+
+def _parse_file(filepath: str) -> ast.Module:
+    with open(filepath) as f:
+        return ast.parse(f.read(), filename=filepath)
+
+
+def _classes_in_tree(
+    tree: ast.AST, filepath: str, name_pattern: str,
+) -> list[dict[str, Any]]:
+    return [
+        {"name": node.name, "file": filepath, "line": node.lineno}
+        for node in _iter_class_defs(tree)
+        if name_pattern in node.name
+    ]
+
+
+def _methods_in_tree(
+    tree: ast.AST, filepath: str, class_name: str,
+) -> list[dict[str, Any]]:
+    results = []
+    for node in _iter_class_defs(tree):
+        if node.name == class_name:
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    results.append(
+                        {
+                            "name": item.name,
+                            "file": filepath,
+                            "line": item.lineno,
+                            "args": [
+                                a.arg
+                                for a in item.args.args
+                                if a.arg != "self"
+                            ],
+                        }
+                    )
+    return results
+
+
+# Process-pool entry points: parse in the worker, return only the matches
+
+def _classes_in_file(filepath: str, name_pattern: str) -> list[dict[str, Any]]:
+    try:
+        tree = _parse_file(filepath)
+    except (SyntaxError, OSError):
+        return []
+    return _classes_in_tree(tree, filepath, name_pattern)
+
+
+def _methods_in_file(filepath: str, class_name: str) -> list[dict[str, Any]]:
+    try:
+        tree = _parse_file(filepath)
+    except (SyntaxError, OSError):
+        return []
+    return _methods_in_tree(tree, filepath, class_name)
+
+
+def _search_file(
+    filepath: str, pattern: re.Pattern[Any], literal: bool,
+) -> list[dict[str, Any]]:
+    """Match one file; a literal pattern is a bytes pattern run via mmap."""
+    try:
+        if literal:
+            if not _file_matches(filepath, pattern):
+                return []
+            with open(filepath) as f:
+                content = f.read()
+        else:
+            with open(filepath) as f:
+                content = f.read()
+            if not pattern.search(content):
+                return []
+    except (OSError, UnicodeDecodeError):
+        return []
+    return [{"file": filepath, "content_preview": content[:200]}]
+
 
 @dataclass
 class CodeAnalyzer:
     root_path: str
+    # Processes used for repo-wide scans; 1 keeps everything in-process
+    # (and is the only mode that reuses the AST cache)
+    workers: int = 1
+    # filepath -> ((mtime_ns, size), tree); reused until the file changes
+    _ast_cache: dict[str, tuple[tuple[int, int], ast.Module]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    # filepath -> (tree, class name -> first ClassDef); valid while the
+    # tree is still the one in _ast_cache
+    _class_index: dict[str, tuple[ast.Module, dict[str, ast.ClassDef]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def _parsed(self, filepath: str) -> ast.Module:
+        """Parse a Python file, reusing the cached tree while it is unchanged.
+
+        Raises OSError or SyntaxError like open() and ast.parse().
+        """
+        st = os.stat(filepath)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._ast_cache.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        tree = _parse_file(filepath)
+        self._ast_cache[filepath] = (stamp, tree)
+        return tree
+
+    def _find_class(self, filepath: str, class_name: str) -> ast.ClassDef | None:
+        """Look up a class in a file by name, indexing each tree once."""
+        tree = self._parsed(filepath)
+        cached = self._class_index.get(filepath)
+        if cached is not None and cached[0] is tree:
+            return cached[1].get(class_name)
+        index: dict[str, ast.ClassDef] = {}
+        for node in _iter_class_defs(tree):
+            index.setdefault(node.name, node)
+        self._class_index[filepath] = (tree, index)
+        return index.get(class_name)
+
+    def _scan_pooled(
+        self,
+        fn: Callable[[str], list[dict[str, Any]]],
+        filepaths: list[str],
+    ) -> list[dict[str, Any]] | None:
+        """Run fn over filepaths in a process pool, or None if not worth it."""
+        if self.workers <= 1 or len(filepaths) < _PARALLEL_MIN_FILES:
+            return None
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return [
+                r for rs in pool.map(fn, filepaths, chunksize=16) for r in rs
+            ]
+
+    def _scan_trees(
+        self,
+        extract: Callable[[ast.AST, str], list[dict[str, Any]]],
+        filepaths: list[str],
+    ) -> list[dict[str, Any]]:
+        """Run extract over each file's cached tree, skipping unparsable files."""
+        results = []
+        for filepath in filepaths:
+            try:
+                tree = self._parsed(filepath)
+            except (SyntaxError, OSError):
+                continue
+            results.extend(extract(tree, filepath))
+        return results
 
     def find_files(self, pattern: str) -> list[str]:
-        """Find files matching a glob pattern recursively."""
+        """Find files matching a glob pattern recursively.
+
+        VCS, cache and virtualenv directories (_SKIP_DIRS) are not entered.
+        """
         matches = []
-        for dirpath, _, filenames in os.walk(self.root_path):
-            for filename in filenames:
-                if fnmatch.fnmatch(filename, pattern):
-                    matches.append(os.path.join(dirpath, filename))
+        for dirpath, dirnames, filenames in os.walk(self.root_path):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            for filename in fnmatch.filter(filenames, pattern):
+                matches.append(os.path.join(dirpath, filename))
         return sorted(matches)
 
     def search(
         self, keyword: str, *, file_pattern: str = "*.py", case_insensitive: bool = False
     ) -> list[dict[str, Any]]:
-        """Search for keyword in file contents."""
+        """Search for keyword in file contents.
+
+        Plain ASCII keywords are matched against the memory-mapped bytes,
+        so non-matching files are never copied or decoded; anything else
+        is compiled as a regex once.
+        """
         flags = re.IGNORECASE if case_insensitive else 0
-        results = []
-        for filepath in self.find_files(file_pattern):
-            try:
-                with open(filepath) as f:
-                    content = f.read()
-                if re.search(keyword, content, flags):
-                    results.append({"file": filepath, "content_preview": content[:200]})
-            except (OSError, UnicodeDecodeError):
-                continue
-        return results
+        literal = keyword.isascii() and re.escape(keyword) == keyword
+        pattern = re.compile(keyword.encode() if literal else keyword, flags)
+        scan = partial(_search_file, pattern=pattern, literal=literal)
+        filepaths = self.find_files(file_pattern)
+        pooled = self._scan_pooled(scan, filepaths)
+        if pooled is not None:
+            return pooled
+        return [r for fp in filepaths for r in scan(fp)]
 
     def find_classes(self, name_pattern: str) -> list[dict[str, Any]]:
         """Find class definitions matching a name pattern."""
-        results = []
-        for filepath in self.find_files("*.py"):
-            try:
-                with open(filepath) as f:
-                    tree = ast.parse(f.read(), filename=filepath)
-            except (SyntaxError, OSError):
-                continue
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and name_pattern in node.name:
-                    results.append(
-                        {
-                            "name": node.name,
-                            "file": filepath,
-                            "line": node.lineno,
-                        }
-                    )
-        return results
+        filepaths = self.find_files("*.py")
+        pooled = self._scan_pooled(
+            partial(_classes_in_file, name_pattern=name_pattern), filepaths,
+        )
+        if pooled is not None:
+            return pooled
+        return self._scan_trees(
+            partial(_classes_in_tree, name_pattern=name_pattern), filepaths,
+        )
 
     def find_methods(self, class_name: str) -> list[dict[str, Any]]:
         """Find all methods of a class by name."""
-        results = []
-        for filepath in self.find_files("*.py"):
-            try:
-                with open(filepath) as f:
-                    tree = ast.parse(f.read(), filename=filepath)
-            except (SyntaxError, OSError):
-                continue
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and node.name == class_name:
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            results.append(
-                                {
-                                    "name": item.name,
-                                    "file": filepath,
-                                    "line": item.lineno,
-                                    "args": [
-                                        a.arg
-                                        for a in item.args.args
-                                        if a.arg != "self"
-                                    ],
-                                }
-                            )
-        return results
+        filepaths = self.find_files("*.py")
+        pooled = self._scan_pooled(
+            partial(_methods_in_file, class_name=class_name), filepaths,
+        )
+        if pooled is not None:
+            return pooled
+        return self._scan_trees(
+            partial(_methods_in_tree, class_name=class_name), filepaths,
+        )
 
     def extract_interface(
         self, filepath: str, class_name: str
     ) -> dict[str, Any]:
         """Extract public interface of a class: methods, signatures, docstrings."""
-        with open(filepath) as f:
-            tree = ast.parse(f.read(), filename=filepath)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                methods = []
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        docstring = ast.get_docstring(item)
-                        methods.append(
-                            {
-                                "name": item.name,
-                                "args": [
-                                    a.arg
-                                    for a in item.args.args
-                                    if a.arg != "self"
-                                ],
-                                "docstring": docstring,
-                                "line": item.lineno,
-                            }
-                        )
-                return {
-                    "class_name": class_name,
-                    "docstring": ast.get_docstring(node),
-                    "methods": methods,
-                    "file": filepath,
-                }
-        return {"class_name": class_name, "docstring": None, "methods": [], "file": filepath}
+        node = self._find_class(filepath, class_name)
+        if node is None:
+            return {"class_name": class_name, "docstring": None, "methods": [], "file": filepath}
+
+        methods = []
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                docstring = ast.get_docstring(item)
+                methods.append(
+                    {
+                        "name": item.name,
+                        "args": [
+                            a.arg
+                            for a in item.args.args
+                            if a.arg != "self"
+                        ],
+                        "docstring": docstring,
+                        "line": item.lineno,
+                    }
+                )
+        return {
+            "class_name": class_name,
+            "docstring": ast.get_docstring(node),
+            "methods": methods,
+            "file": filepath,
+        }
@@ -7,25 +7,48 @@ Hook configuration is loaded from hooks.yaml.
 from __future__ import annotations
 
 import json
+import os
+import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
 from typing import Any, Callable
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from src.state import (
     AuditStatus,
     Draft,
     HumanApproval,
     ProjectState,
     ReviewResult,
+    Scope,
     Task,
     TaskType,
 )
 
 
-@dataclass
+# abspath -> ((mtime_ns, size), parsed YAML), least recently used first;
+# configs are rebuilt per load so callers never share mutable state
+_HOOK_CACHE: OrderedDict[str, tuple[tuple[int, int], dict[str, Any]]] = OrderedDict()
+_HOOK_CACHE_SIZE = 32
+
+
+@dataclass(slots=True, frozen=True)
 class HookStepConfig:
     """Configuration for a single hook step (ai_review, human_check, or brainstorm)."""
     enabled: bool = True
@@ -36,29 +59,46 @@ class HookStepConfig:
     critical_path_threshold: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class HookConfig:
     """Configuration for all hooks."""
     hooks: dict[str, dict[str, HookStepConfig]] = field(default_factory=dict)
 
     @classmethod
     def load(cls, path: str = "hooks.yaml") -> HookConfig:
-        """Load hook configuration from YAML."""
+        """Load hook configuration from YAML.
+
+        The parsed file is cached per process and reused until its
+        mtime or size changes.
+        """
+        key = os.path.abspath(path)
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
+            st = os.stat(path)
         except FileNotFoundError:
+            _HOOK_CACHE.pop(key, None)
             return cls()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _HOOK_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            _HOOK_CACHE.move_to_end(key)
+            data = cached[1]
+        else:
+            with open(path) as f:
+                data = yaml.load(f, Loader=SafeLoader) or {}
+            _HOOK_CACHE[key] = (stamp, data)
+            _HOOK_CACHE.move_to_end(key)
+            if len(_HOOK_CACHE) > _HOOK_CACHE_SIZE:
+                _HOOK_CACHE.popitem(last=False)
         hooks = {}
         for hook_name, steps in data.get("hooks", {}).items():
             hooks[hook_name] = {}
             for step_name, step_data in (steps or {}).items():
                 hooks[hook_name][step_name] = HookStepConfig(
                     enabled=step_data.get("enabled", True),
-                    checks=step_data.get("checks", []),
+                    checks=list(step_data.get("checks", ())),
                     mode=step_data.get("mode", "interactive"),
                     file_path=step_data.get("file_path", ""),
-                    auto_defer_keywords=step_data.get("auto_defer_keywords", []),
+                    auto_defer_keywords=list(step_data.get("auto_defer_keywords", ())),
                     critical_path_threshold=step_data.get("critical_path_threshold", 3),
                 )
         return cls(hooks=hooks)
@@ -80,6 +120,80 @@ class HookConfig:
 
 # -- AI Review Checks -------------------------------------------------------
 
+# Task types that produce code, so must not target frozen components
+_DEV_TYPES = frozenset({TaskType.NEW, TaskType.EXTEND})
+# Searched case-insensitively in place, without a lowered copy per text
+_NOT_DEVELOPABLE = re.compile("not developable", re.IGNORECASE)
+
+
+@dataclass
+class _AuditView:
+    """Facts the audit checks need, gathered in one pass over audit_results."""
+    terms: set[str]
+    has_in_progress: bool
+    extensible_not_developable: list[str]
+
+    @classmethod
+    def build(cls, state: ProjectState) -> _AuditView:
+        terms: set[str] = set()
+        has_in_progress = False
+        flagged: list[str] = []
+        for item in state.audit_results:
+            if term := item.details.get("matched_term", ""):
+                terms.add(term)
+            if item.status == AuditStatus.IN_PROGRESS:
+                has_in_progress = True
+            elif (
+                item.status == AuditStatus.EXTENSIBLE
+                and _NOT_DEVELOPABLE.search(item.description)
+            ):
+                flagged.append(item.component)
+        return cls(terms, has_in_progress, flagged)
+
+
+@dataclass
+class _TaskView:
+    """Facts the task checks need, gathered in one pass over tasks."""
+    task_map: dict[str, Task]
+    large_count: int
+    # NEW/EXTEND tasks whose description says "not developable"
+    frozen_targets: list[Task]
+
+    @classmethod
+    def build(cls, state: ProjectState) -> _TaskView:
+        task_map: dict[str, Task] = {}
+        large_count = 0
+        frozen: list[Task] = []
+        for task in state.tasks:
+            task_map[task.id] = task
+            if task.estimated_scope is Scope.LARGE:
+                large_count += 1
+            if (
+                task.type in _DEV_TYPES
+                and _NOT_DEVELOPABLE.search(task.description)
+            ):
+                frozen.append(task)
+        return cls(task_map, large_count, frozen)
+
+
+class _ReviewView:
+    """State view shared by the checks of one run_ai_review call.
+
+    Each half is built on first use, so a review running only task
+    checks never walks the audit results (and vice versa).
+    """
+
+    def __init__(self, state: ProjectState) -> None:
+        self.state = state
+
+    @cached_property
+    def audit(self) -> _AuditView:
+        return _AuditView.build(self.state)
+
+    @cached_property
+    def tasks(self) -> _TaskView:
+        return _TaskView.build(self.state)
+
 
 def run_ai_review(
     state: ProjectState,
@@ -87,24 +201,20 @@ def run_ai_review(
     checks: list[str],
 ) -> ReviewResult:
     """Run AI review checks and return the result."""
+    if not checks:
+        return ReviewResult(
+            hook_name=hook_name, approved=True, issues=[], suggestions=[],
+        )
     issues: list[str] = []
     suggestions: list[str] = []
-
-    check_functions: dict[str, Callable] = {
-        "completeness": _check_completeness,
-        "branch_awareness": _check_branch_awareness,
-        "developable_respect": _check_developable_respect,
-        "dependency_order": _check_dependency_order,
-        "scope_sanity": _check_scope_sanity,
-        "no_frozen_mutation": _check_no_frozen_mutation,
-    }
+    view = _ReviewView(state)
 
     for check_name in checks:
-        fn = check_functions.get(check_name)
+        fn = _AI_CHECKS.get(check_name)
         if fn is None:
             issues.append(f"Unknown check: {check_name}")
             continue
-        check_issues, check_suggestions = fn(state)
+        check_issues, check_suggestions = fn(state, view)
         issues.extend(check_issues)
         suggestions.extend(check_suggestions)
 
@@ -116,126 +226,148 @@ def run_ai_review(
     )
 
 
-def _check_completeness(state: ProjectState) -> tuple[list[str], list[str]]:
+def _check_completeness(
+    state: ProjectState, view: _ReviewView,
+) -> tuple[list[str], list[str]]:
     """Verify every keyword from parsed_intent has an audit result."""
     issues = []
     suggestions = []
-    keywords = set(
-        state.parsed_intent.get("keywords", [])
-        + state.parsed_intent.get("domain", [])
-        + state.parsed_intent.get("method", [])
-    )
-    audited_terms = set()
-    for item in state.audit_results:
-        term = item.details.get("matched_term", "")
-        if term:
-            audited_terms.add(term)
-    missing = keywords - audited_terms
+    intent = state.parsed_intent
+    keywords = set(chain(
+        intent.get("keywords", ()),
+        intent.get("domain", ()),
+        intent.get("method", ()),
+    ))
+    if not keywords:  # nothing to cover; don't build the audit view for it
+        return issues, suggestions
+    missing = keywords - view.audit.terms
     if missing:
         issues.append(f"Keywords not covered by audit: {sorted(missing)}")
         suggestions.append("Re-run audit with missing keywords added to search terms")
     return issues, suggestions
 
 
-def _check_branch_awareness(state: ProjectState) -> tuple[list[str], list[str]]:
+def _check_branch_awareness(
+    state: ProjectState, view: _ReviewView,
+) -> tuple[list[str], list[str]]:
     """Verify IN_PROGRESS items exist if there are active branches."""
     issues = []
     suggestions = []
-    has_in_progress = any(
-        item.status == AuditStatus.IN_PROGRESS for item in state.audit_results
-    )
+    has_in_progress = view.audit.has_in_progress
     # This is a soft check — if no IN_PROGRESS found, it might just mean
     # no branches exist. We only flag if there's a hint that branches were missed.
     # For now, just pass.
     return issues, suggestions
 
 
-def _check_developable_respect(state: ProjectState) -> tuple[list[str], list[str]]:
+def _check_developable_respect(
+    state: ProjectState, view: _ReviewView,
+) -> tuple[list[str], list[str]]:
     """Verify audit correctly flags non-developable components."""
     # This check validates that EXTENSIBLE status isn't assigned to items
     # whose description mentions "not developable"
     issues = []
     suggestions = []
-    for item in state.audit_results:
-        if item.status == AuditStatus.EXTENSIBLE and "not developable" in item.description.lower():
-            issues.append(
-                f"Component {item.component} marked EXTENSIBLE but flagged as not developable"
-            )
+    for component in view.audit.extensible_not_developable:
+        issues.append(
+            f"Component {component} marked EXTENSIBLE but flagged as not developable"
+        )
     return issues, suggestions
 
 
-def _check_dependency_order(state: ProjectState) -> tuple[list[str], list[str]]:
+def _check_dependency_order(
+    state: ProjectState, view: _ReviewView,
+) -> tuple[list[str], list[str]]:
     """Verify task dependency DAG is valid."""
     issues = []
     suggestions = []
-    task_ids = {t.id for t in state.tasks}
+    task_map = view.tasks.task_map
 
     for task in state.tasks:
         for dep in task.dependencies:
-            if dep not in task_ids:
+            if dep not in task_map:
                 issues.append(f"Task {task.id} depends on unknown task {dep}")
 
-    # Check for cycles (simple DFS)
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-    task_map = {t.id: t for t in state.tasks}
-
-    def has_cycle(task_id: str) -> bool:
-        visited.add(task_id)
-        rec_stack.add(task_id)
-        task = task_map.get(task_id)
-        if task:
-            for dep in task.dependencies:
-                if dep not in visited:
-                    if has_cycle(dep):
-                        return True
-                elif dep in rec_stack:
+    # Check for cycles: iterative DFS over (task_id, pending deps) frames,
+    # so deep chains can't hit the recursion limit. Colors: 0 unvisited,
+    # 1 on the current path, 2 finished; unknown deps have no color.
+    color = dict.fromkeys(task_map, 0)
+
+    def has_cycle(root: str) -> bool:
+        color[root] = 1
+        stack = [(root, iter(task_map[root].dependencies))]
+        while stack:
+            task_id, deps = stack[-1]
+            for dep in deps:
+                c = color.get(dep)
+                if c == 1:
                     return True
-        rec_stack.discard(task_id)
+                if c == 0:
+                    color[dep] = 1
+                    stack.append((dep, iter(task_map[dep].dependencies)))
+                    break
+            else:
+                stack.pop()
+                color[task_id] = 2
         return False
 
-    for tid in task_ids:
-        if tid not in visited:
-            if has_cycle(tid):
-                issues.append("Dependency cycle detected in task graph")
-                suggestions.append("Review task dependencies for circular references")
-                break
+    for task in state.tasks:
+        if color[task.id] == 0 and has_cycle(task.id):
+            issues.append("Dependency cycle detected in task graph")
+            suggestions.append("Review task dependencies for circular references")
+            break
 
     return issues, suggestions
 
 
-def _check_scope_sanity(state: ProjectState) -> tuple[list[str], list[str]]:
+def _check_scope_sanity(
+    state: ProjectState, view: _ReviewView,
+) -> tuple[list[str], list[str]]:
     """Verify no unreasonable task count or all-large tasks."""
     issues = []
     suggestions = []
     if len(state.tasks) > 20:
         issues.append(f"Too many tasks ({len(state.tasks)}). Consider grouping.")
         suggestions.append("Merge related small tasks into larger units")
-    large_count = sum(1 for t in state.tasks if t.estimated_scope.value == "large")
+    large_count = view.tasks.large_count
     if state.tasks and large_count == len(state.tasks):
         issues.append("All tasks are large scope — consider breaking some down")
     return issues, suggestions
 
 
-def _check_no_frozen_mutation(state: ProjectState) -> tuple[list[str], list[str]]:
+def _check_no_frozen_mutation(
+    state: ProjectState, view: _ReviewView,
+) -> tuple[list[str], list[str]]:
     """Verify no dev tasks generated for non-developable components."""
     issues = []
     suggestions = []
-    for task in state.tasks:
-        if task.type == TaskType.NEW or task.type == TaskType.EXTEND:
-            # Check if the task description mentions "not developable"
-            if "not developable" in task.description.lower():
-                issues.append(
-                    f"Task {task.id} ({task.title}) targets a non-developable component"
-                )
-                suggestions.append(
-                    f"Change task {task.id} to EXTERNAL_DEPENDENCY type"
-                )
+    for task in view.tasks.frozen_targets:
+        issues.append(
+            f"Task {task.id} ({task.title}) targets a non-developable component"
+        )
+        suggestions.append(
+            f"Change task {task.id} to EXTERNAL_DEPENDENCY type"
+        )
     return issues, suggestions
 
 
+_AI_CHECKS: dict[
+    str, Callable[[ProjectState, _ReviewView], tuple[list[str], list[str]]]
+] = {
+    "completeness": _check_completeness,
+    "branch_awareness": _check_branch_awareness,
+    "developable_respect": _check_developable_respect,
+    "dependency_order": _check_dependency_order,
+    "scope_sanity": _check_scope_sanity,
+    "no_frozen_mutation": _check_no_frozen_mutation,
+}
+
+
 # -- Human Check -------------------------------------------------------------
 
+# Answers accepted as approval at an interactive prompt (after lower())
+_YES = frozenset({"y", "yes"})
+
 
 def run_human_check(
     state: ProjectState,
@@ -244,14 +376,19 @@ def run_human_check(
     file_path: str = "",
     *,
     input_fn: Callable[[str], str] | None = None,
+    timeout: float = 0.0,
+    poll_interval: float = 1.0,
 ) -> HumanApproval:
     """Run human approval check. Supports interactive and file modes.
 
     Args:
         input_fn: Override for input() function, useful for testing.
+        timeout: File mode only. Seconds to wait for the review file to
+            be answered; 0 returns the pending (unapproved) result at once.
+        poll_interval: File mode only. Seconds between checks of the file.
     """
     if mode == "file":
-        return _human_check_file(hook_name, file_path)
+        return _human_check_file(hook_name, file_path, timeout, poll_interval)
     return _human_check_interactive(state, hook_name, input_fn=input_fn)
 
 
@@ -279,7 +416,7 @@ def _human_check_interactive(
 
     print()
     response = prompt_fn("Approve? (y/n): ").strip().lower()
-    approved = response in ("y", "yes")
+    approved = response in _YES
 
     feedback = None
     if not approved:
@@ -289,16 +426,17 @@ def _human_check_interactive(
         hook_name=hook_name,
         approved=approved,
         feedback=feedback,
-        timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
     )
 
 
-def _human_check_file(hook_name: str, file_path: str) -> HumanApproval:
-    """File-based human check. Writes pending review, reads response."""
-    path = Path(file_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+def _publish_pending(path: Path, hook_name: str) -> dict[str, Any]:
+    """Write the pending review file and return what was written.
 
-    # Write pending review
+    The file is written beside the target and renamed over it, so a
+    reviewer's tool never sees it half-written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
     pending = {
         "hook_name": hook_name,
         "status": "pending",
@@ -306,10 +444,60 @@ def _human_check_file(hook_name: str, file_path: str) -> HumanApproval:
         "approved": None,
         "feedback": None,
     }
-    path.write_text(json.dumps(pending, indent=2))
-
-    # Read response (in real usage this would poll; here we just read once)
-    data = json.loads(path.read_text())
+    if orjson is not None:
+        payload = orjson.dumps(pending, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(pending, indent=2).encode()
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+    return pending
+
+
+def _await_response(
+    path: Path,
+    pending: dict[str, Any],
+    timeout: float,
+    poll_interval: float,
+) -> dict[str, Any]:
+    """Poll the review file until it carries a decision or timeout elapses.
+
+    The file is only re-parsed when its mtime or size changes; until
+    then (and on timeout) the published ``pending`` dict is returned.
+    """
+    data = pending
+    deadline = time.monotonic() + timeout
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    while (remaining := deadline - time.monotonic()) > 0:
+        time.sleep(min(poll_interval, remaining))
+        try:
+            st = path.stat()
+            if (st.st_mtime_ns, st.st_size) == stamp:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            raw = path.read_bytes()
+            parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            continue  # missing or half-written; try again next poll
+        if not isinstance(parsed, dict):
+            continue  # not a review object; keep the last good one
+        data = parsed
+        if data.get("approved") is not None:
+            break
+    return data
+
+
+def _human_check_file(
+    hook_name: str,
+    file_path: str,
+    timeout: float = 0.0,
+    poll_interval: float = 1.0,
+) -> HumanApproval:
+    """File-based human check. Writes pending review, polls for the response."""
+    path = Path(file_path)
+    pending = _publish_pending(path, hook_name)
+    data = _await_response(path, pending, timeout, poll_interval)
     approved = data.get("approved", False)
     if approved is None:
         approved = False
@@ -318,7 +506,7 @@ def _human_check_file(hook_name: str, file_path: str) -> HumanApproval:
         hook_name=hook_name,
         approved=bool(approved),
         feedback=data.get("feedback"),
-        timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
     )
 
 
@@ -355,8 +543,7 @@ def _check_diff_size(
     """Warn if diff is unusually large."""
     issues: list[str] = []
     suggestions: list[str] = []
-    total_lines = sum(content.count("\n") for content in draft.files.values())
-    total_lines += sum(content.count("\n") for content in draft.test_files.values())
+    total_lines = draft.total_lines
     if total_lines > 1000:
         suggestions.append(
             f"Task {task.id}: large diff ({total_lines} lines). Consider splitting."
@@ -364,6 +551,13 @@ def _check_diff_size(
     return issues, suggestions
 
 
+_TASK_CHECKS: dict[str, Callable[..., tuple[list[str], list[str]]]] = {
+    "tests_pass": _check_tests_pass,
+    "commit_exists": _check_commit_exists,
+    "diff_size": _check_diff_size,
+}
+
+
 def run_task_review(
     state: ProjectState,
     task: Task,
@@ -389,16 +583,10 @@ def run_task_review(
                 checks_to_run = ai_config.checks
 
     # Run AI checks
-    task_check_functions: dict[str, Callable] = {
-        "tests_pass": _check_tests_pass,
-        "commit_exists": _check_commit_exists,
-        "diff_size": _check_diff_size,
-    }
-
     issues: list[str] = []
     suggestions: list[str] = []
     for check_name in checks_to_run:
-        fn = task_check_functions.get(check_name)
+        fn = _TASK_CHECKS.get(check_name)
         if fn is None:
             issues.append(f"Unknown task check: {check_name}")
             continue
@@ -432,12 +620,31 @@ def run_task_review(
         approval = HumanApproval(
             hook_name=hook_name,
             approved=True,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            timestamp=datetime.now().isoformat(timespec="seconds"),
         )
 
     return review, approval
 
 
+def _head_lines(text: str, n: int) -> tuple[str, int]:
+    """Return the first n lines of text and how many lines were cut.
+
+    Locates the cut with str.find so a huge diff is never split into a list.
+    """
+    end = -1
+    for _ in range(n):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text, 0
+    rest = text.count("\n", end + 1)
+    if not text.endswith("\n"):
+        rest += 1
+    if rest == 0:
+        # Exactly n lines with a trailing newline: nothing was cut
+        return text, 0
+    return text[:end], rest
+
+
 def _human_check_task(
     state: ProjectState,
     task: Task,
@@ -465,19 +672,17 @@ def _human_check_task(
             if diff:
                 print(f"\n--- Diff ---")
                 # Truncate very long diffs
-                lines = diff.splitlines()
-                if len(lines) > 100:
-                    print("\n".join(lines[:100]))
-                    print(f"\n... ({len(lines) - 100} more lines)")
-                else:
-                    print(diff)
+                head, more = _head_lines(diff, 100)
+                print(head)
+                if more:
+                    print(f"\n... ({more} more lines)")
         except Exception:
             print("\n(Could not retrieve diff)")
 
     print(f"\nExplanation: {draft.explanation[:200]}")
     print()
     response = prompt_fn("Approve task? (y/n): ").strip().lower()
-    approved = response in ("y", "yes")
+    approved = response in _YES
 
     feedback = None
     if not approved:
@@ -487,7 +692,7 @@ def _human_check_task(
         hook_name=hook_name,
         approved=approved,
         feedback=feedback,
-        timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
     )
 
 
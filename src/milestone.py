@@ -6,14 +6,19 @@ scope reductions when velocity indicates the project will miss its deadline.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import cached_property
+from operator import itemgetter
 from typing import Any
 
-from src.velocity import compute_velocity, forecast_completion
+from src.velocity import forecast_completion
 
+_RISK_SCORES = {"high": 30, "medium": 20, "low": 10}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MilestoneReview:
     """Result of a milestone review checkpoint."""
 
@@ -39,20 +44,58 @@ class MilestoneReview:
         }
 
 
+@dataclass
+class ProjectIndex:
+    """Milestone-independent lookups over one task list, built on first use.
+
+    Share one index across reviews of the same tasks (run_all_milestones
+    does); build a new one once the task list changes.
+    """
+
+    tasks: list[dict[str, Any]]
+    # (deadline, window_weeks, as_of) -> forecast_completion result
+    _forecasts: dict[tuple[str, int, datetime], dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    @cached_property
+    def task_map(self) -> dict[str, dict[str, Any]]:
+        return {t["id"]: t for t in self.tasks}
+
+    @cached_property
+    def rescope_candidates(self) -> list[tuple[float, dict[str, Any]]]:
+        """(priority, task) for pending leaf tasks, lowest priority first."""
+        return _rank_rescope_candidates(self.tasks)
+
+    def forecast(
+        self, deadline: str, window_weeks: int, as_of: datetime,
+    ) -> dict[str, Any]:
+        """forecast_completion for these tasks, computed once per arguments."""
+        key = (deadline, window_weeks, as_of)
+        result = self._forecasts.get(key)
+        if result is None:
+            result = forecast_completion(self.tasks, deadline, window_weeks, as_of)
+            self._forecasts[key] = result
+        return result
+
+
 def check_milestone_gate(
     tasks: list[dict[str, Any]],
     milestone_task_ids: list[str],
+    *,
+    index: ProjectIndex | None = None,
 ) -> dict[str, Any]:
     """Check completion status for a milestone's covered tasks.
 
     Args:
         tasks: All project tasks (list of dicts).
         milestone_task_ids: Task IDs that this milestone covers.
+        index: Prebuilt index over ``tasks``, reused across milestones.
 
     Returns:
         Dict with covered, done, pending, progress_pct.
     """
-    task_map = {t["id"]: t for t in tasks}
+    task_map = index.task_map if index is not None else {t["id"]: t for t in tasks}
     covered = [task_map[tid] for tid in milestone_task_ids if tid in task_map]
     done = [t for t in covered if t.get("status") in ("done", "terminated")]
     total = len(covered)
@@ -80,29 +123,56 @@ def _get_task_priority(task: dict[str, Any]) -> float:
             pass
 
     # Fallback: derive from risk_level and dependency count
-    risk_scores = {"high": 30, "medium": 20, "low": 10}
-    base = risk_scores.get(task.get("risk_level", ""), 15)
+    base = _RISK_SCORES.get(task.get("risk_level", ""), 15)
 
     # Tasks with more dependents are more important
     return base
 
 
+def _rank_rescope_candidates(
+    tasks: list[dict[str, Any]],
+) -> list[tuple[float, dict[str, Any]]]:
+    """Pair pending tasks nothing depends on with their priority, ascending."""
+    # Find all task IDs that are depended on
+    depended_on: set[str] = set()
+    for t in tasks:
+        depended_on.update(t.get("dependencies", ()))
+
+    # Candidate tasks: pending, not blocking others
+    candidates = [
+        t for t in tasks
+        if t.get("status") in ("pending",)
+        and t["id"] not in depended_on
+    ]
+
+    # Sort by priority ascending (lowest priority first), scoring each once
+    return sorted(
+        zip(map(_get_task_priority, candidates), candidates), key=itemgetter(0),
+    )
+
+
 def suggest_rescope(
     tasks: list[dict[str, Any]],
     deadline: str,
     window_weeks: int = 2,
     as_of: datetime | None = None,
+    *,
+    index: ProjectIndex | None = None,
 ) -> list[dict[str, str]]:
     """Suggest tasks to defer to meet the deadline.
 
     Picks lowest-priority pending tasks with no downstream dependents
-    until the forecast fits within the deadline.
+    until the forecast fits within the deadline. A prebuilt ``index``
+    over ``tasks`` supplies the forecast and ranked candidates.
 
     Returns list of {task_id, title, reason} suggestions.
     """
     as_of = as_of or datetime.now()
 
-    forecast = forecast_completion(tasks, deadline, window_weeks, as_of)
+    if index is not None:
+        forecast = index.forecast(deadline, window_weeks, as_of)
+    else:
+        forecast = forecast_completion(tasks, deadline, window_weeks, as_of)
     if forecast["on_track"] or forecast["tasks_remaining"] == 0:
         return []
 
@@ -112,36 +182,25 @@ def suggest_rescope(
         return [{"task_id": "*", "title": "No velocity data",
                  "reason": "Cannot suggest rescope without completion history"}]
 
-    # Find all task IDs that are depended on
-    depended_on: set[str] = set()
-    for t in tasks:
-        for dep in t.get("dependencies", []):
-            depended_on.add(dep)
-
-    # Candidate tasks: pending, not blocking others
-    candidates = [
-        t for t in tasks
-        if t.get("status") in ("pending",)
-        and t["id"] not in depended_on
-    ]
-
-    # Sort by priority ascending (lowest priority first)
-    candidates.sort(key=_get_task_priority)
+    if index is not None:
+        ranked = index.rescope_candidates
+    else:
+        ranked = _rank_rescope_candidates(tasks)
 
     suggestions = []
     remaining = forecast["tasks_remaining"]
+    dl = datetime.fromisoformat(deadline)
 
-    for t in candidates:
+    for priority, t in ranked:
         weeks_needed = remaining / velocity
-        forecast_date = as_of + __import__("datetime").timedelta(weeks=weeks_needed)
-        dl = datetime.fromisoformat(deadline)
+        forecast_date = as_of + timedelta(weeks=weeks_needed)
         if forecast_date <= dl:
             break
 
         suggestions.append({
             "task_id": t["id"],
             "title": t.get("title", ""),
-            "reason": f"Low priority leaf task (score={_get_task_priority(t):.0f}), "
+            "reason": f"Low priority leaf task (score={priority:.0f}), "
                       f"deferring saves ~{1/velocity:.1f} weeks",
         })
         remaining -= 1
@@ -156,6 +215,8 @@ def run_milestone_review(
     deadline: str,
     window_weeks: int = 2,
     as_of: datetime | None = None,
+    *,
+    index: ProjectIndex | None = None,
 ) -> MilestoneReview:
     """Run a full milestone review: gate check + velocity + rescope.
 
@@ -166,19 +227,24 @@ def run_milestone_review(
         deadline: Project deadline (ISO string).
         window_weeks: Velocity calculation window.
         as_of: Reference date.
+        index: Prebuilt index over ``tasks``; built here if omitted.
 
     Returns:
         MilestoneReview with progress, velocity, forecast, and rescope suggestions.
     """
     as_of = as_of or datetime.now()
+    if index is None:
+        index = ProjectIndex(tasks)
 
-    gate = check_milestone_gate(tasks, milestone_task_ids)
-    vel = compute_velocity(tasks, window_weeks, as_of)
-    forecast = forecast_completion(tasks, deadline, window_weeks, as_of)
+    gate = check_milestone_gate(tasks, milestone_task_ids, index=index)
+    forecast = index.forecast(deadline, window_weeks, as_of)
+    vel = forecast["velocity"]
 
     suggestions = []
     if not forecast["on_track"]:
-        suggestions = suggest_rescope(tasks, deadline, window_weeks, as_of)
+        suggestions = suggest_rescope(
+            tasks, deadline, window_weeks, as_of, index=index,
+        )
 
     return MilestoneReview(
         milestone_id=milestone_id,
@@ -190,3 +256,33 @@ def run_milestone_review(
         on_track=forecast["on_track"],
         rescope_suggestions=suggestions,
     )
+
+
+def run_all_milestones(
+    tasks: list[dict[str, Any]],
+    milestones: Mapping[str, list[str]],
+    deadline: str,
+    window_weeks: int = 2,
+    as_of: datetime | None = None,
+) -> list[MilestoneReview]:
+    """Review every milestone against one shared index of the tasks.
+
+    Args:
+        tasks: All project tasks.
+        milestones: Milestone ID -> task IDs it covers.
+        deadline: Project deadline (ISO string).
+        window_weeks: Velocity calculation window.
+        as_of: Reference date, fixed for all milestones.
+
+    Returns:
+        One MilestoneReview per milestone, in mapping order.
+    """
+    as_of = as_of or datetime.now()
+    index = ProjectIndex(tasks)
+    return [
+        run_milestone_review(
+            tasks, milestone_id, task_ids, deadline, window_weeks, as_of,
+            index=index,
+        )
+        for milestone_id, task_ids in milestones.items()
+    ]
@@ -1,26 +1,49 @@
 """Registry of available optimization agents."""
+import importlib
+
 from src.optimizer.agents.base import BaseOptimizationAgent
 
+# Built-in agents as "module:class" specs, imported on first get()
+_BUILTIN_AGENTS = {
+    "deliverable-analyzer": "src.optimizer.agents.deliverable_analyzer:DeliverableAnalyzer",
+    "task-decomposer": "src.optimizer.agents.task_decomposer:TaskDecomposer",
+}
+
 
 class AgentRegistry:
-    """Registry of available optimization agents."""
+    """Registry of available optimization agents.
+
+    Agents known only by spec are instantiated on first lookup, so
+    their modules are not imported until an optimization needs them.
+    """
 
     def __init__(self):
         self._agents: dict[str, BaseOptimizationAgent] = {}
-        # Future agents will be registered here:
-        # self._agents["deliverable-analyzer"] = DeliverableAnalyzer()
-        # self._agents["task-decomposer"] = TaskDecomposer()
+        self._specs: dict[str, str] = dict(_BUILTIN_AGENTS)
 
     def get(self, agent_name: str) -> BaseOptimizationAgent:
-        """Get agent by name."""
-        if agent_name not in self._agents:
+        """Get agent by name, importing and instantiating it on first use."""
+        try:
+            return self._agents[agent_name]
+        except KeyError:
+            pass
+        spec = self._specs.get(agent_name)
+        if spec is None:
             raise ValueError(f"Unknown agent: {agent_name}")
-        return self._agents[agent_name]
+        module_name, _, class_name = spec.partition(":")
+        agent = getattr(importlib.import_module(module_name), class_name)()
+        self._agents[agent_name] = agent
+        return agent
 
     def list_agents(self) -> list[str]:
         """List all available agent names."""
-        return list(self._agents.keys())
+        return [*self._specs, *(n for n in self._agents if n not in self._specs)]
 
     def register(self, name: str, agent: BaseOptimizationAgent) -> None:
         """Register a new agent."""
         self._agents[name] = agent
+
+    def register_lazy(self, name: str, spec: str) -> None:
+        """Register an agent by "module:class" spec, imported on first get()."""
+        self._specs[name] = spec
+        self._agents.pop(name, None)
@@ -1,7 +1,14 @@
 """Base protocol for optimization agents."""
+import json
 from typing import Protocol, Any
 from pathlib import Path
 from src.state import ProjectState
+from src.optimizer.models import OptimizationFinding
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 class BaseOptimizationAgent(Protocol):
@@ -11,6 +18,26 @@ class BaseOptimizationAgent(Protocol):
         """Generate prompt for agent invocation."""
         ...
 
-    def parse_output(self, output: str) -> Any:
+    def parse_output(self, output: str | bytes) -> Any:
         """Parse agent output into structured result."""
         ...
+
+
+def decode_agent_output(output: str | bytes) -> tuple[dict[str, Any], list[OptimizationFinding]]:
+    """Decode an agent's JSON reply and build its findings in one step.
+
+    Raises ValueError (json.JSONDecodeError included) when the reply is
+    not a JSON object with a list of finding objects, and KeyError when
+    a finding lacks a required field.
+    """
+    data = orjson.loads(output) if orjson is not None else json.loads(output)
+    if not isinstance(data, dict):
+        raise ValueError("Agent output is not a JSON object")
+    raw_findings = data.get("findings")
+    if raw_findings is None:
+        raise ValueError("Missing 'findings' field")
+    if not isinstance(raw_findings, list) or not all(
+        isinstance(f, dict) for f in raw_findings
+    ):
+        raise ValueError("'findings' must be a list of objects")
+    return data, [OptimizationFinding.from_dict(f) for f in raw_findings]
@@ -4,36 +4,18 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 from src.state import ProjectState
+from src.optimizer.agents.base import decode_agent_output
 from src.optimizer.models import OptimizationFinding
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class DeliverableAnalysis:
-    """Result from deliverable analysis."""
-    task_id: str
-    expected_deliverables: list[str]
-    missing_deliverables: list[str]
-    incomplete_deliverables: list[tuple[str, str]]  # (path, issue)
-    test_coverage_gaps: list[str]
-    findings: list[OptimizationFinding]
-
-
-class DeliverableAnalyzer:
-    """Agent that analyzes tasks for missing deliverables and test coverage."""
-
-    def generate_prompt(self, state: ProjectState, project_dir: Path) -> str:
-        """Generate prompt for deliverable analysis."""
-        task_list = self._format_tasks(state.tasks[:20])  # Limit to 20 for context
-
-        return f"""# Deliverable Analysis for {project_dir.name}
+_PROMPT = """# Deliverable Analysis for {project_name}
 
 ## Your Mission
 Analyze tasks to identify missing deliverables, test gaps, and documentation needs.
 
 ## Project Context
-- Total tasks: {len(state.tasks)}
+- Total tasks: {n_tasks}
 - Project type: Scientific computing workflow (deepmodeling ecosystem)
 - Expected deliverables per task type:
   * Core: Python module + unit tests + docstrings
@@ -71,27 +53,43 @@ If analyzing >20 tasks, prioritize by:
 Return findings for top 20 issues only.
 """
 
+
+@dataclass(slots=True, frozen=True)
+class DeliverableAnalysis:
+    """Result from deliverable analysis."""
+    task_id: str
+    expected_deliverables: list[str]
+    missing_deliverables: list[str]
+    incomplete_deliverables: list[tuple[str, str]]  # (path, issue)
+    test_coverage_gaps: list[str]
+    findings: list[OptimizationFinding]
+
+
+class DeliverableAnalyzer:
+    """Agent that analyzes tasks for missing deliverables and test coverage."""
+
+    def generate_prompt(self, state: ProjectState, project_dir: Path) -> str:
+        """Generate prompt for deliverable analysis."""
+        task_list = self._format_tasks(state.tasks[:20])  # Limit to 20 for context
+
+        return _PROMPT.format(
+            project_name=project_dir.name,
+            n_tasks=len(state.tasks),
+            task_list=task_list,
+        )
+
     def _format_tasks(self, tasks) -> str:
         """Format tasks for prompt."""
-        lines = []
-        for task in tasks:
-            lines.append(f"### {task.id}: {task.title}")
-            lines.append(f"Layer: {task.layer.value}")
-            lines.append(f"Type: {task.type.value}")
-            lines.append(f"Description: {task.description[:200]}...")
-            lines.append("")
-        return "\n".join(lines)
-
-    def parse_output(self, output: str) -> DeliverableAnalysis:
+        return "\n".join(
+            f"### {t.id}: {t.title}\nLayer: {t.layer.value}\nType: {t.type.value}\n"
+            f"Description: {t.description[:200]}...\n"
+            for t in tasks
+        )
+
+    def parse_output(self, output: str | bytes) -> DeliverableAnalysis:
         """Parse agent output into structured result."""
         try:
-            data = json.loads(output)
-
-            # Validate required fields
-            if "findings" not in data:
-                raise ValueError("Missing 'findings' field")
-
-            findings = [OptimizationFinding.from_dict(f) for f in data["findings"]]
+            data, findings = decode_agent_output(output)
 
             return DeliverableAnalysis(
                 task_id=data.get("task_id", "unknown"),
@@ -4,29 +4,12 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 from src.state import ProjectState
+from src.optimizer.agents.base import decode_agent_output
 from src.optimizer.models import OptimizationFinding
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class DecompositionPlan:
-    """Result from task decomposition analysis."""
-    task_id: str
-    should_decompose: bool
-    decomposition_reason: str
-    suggested_subtasks: list[dict]  # [{title, description, dependencies, estimated_loc}]
-    findings: list[OptimizationFinding]
-
-
-class TaskDecomposer:
-    """Agent that identifies tasks needing decomposition."""
-
-    def generate_prompt(self, state: ProjectState, project_dir: Path) -> str:
-        """Generate prompt for task decomposition analysis."""
-        task_list = self._format_tasks(state.tasks)
-
-        return f"""# Task Decomposition Analysis for {project_dir.name}
+_PROMPT = """# Task Decomposition Analysis for {project_name}
 
 ## Your Mission
 Identify tasks that are too large/complex and suggest decomposition into subtasks.
@@ -67,27 +50,41 @@ Each finding object:
 CRITICAL: Keep output condensed. Max 2000 tokens total.
 """
 
+
+@dataclass(slots=True, frozen=True)
+class DecompositionPlan:
+    """Result from task decomposition analysis."""
+    task_id: str
+    should_decompose: bool
+    decomposition_reason: str
+    suggested_subtasks: list[dict]  # [{title, description, dependencies, estimated_loc}]
+    findings: list[OptimizationFinding]
+
+
+class TaskDecomposer:
+    """Agent that identifies tasks needing decomposition."""
+
+    def generate_prompt(self, state: ProjectState, project_dir: Path) -> str:
+        """Generate prompt for task decomposition analysis."""
+        task_list = self._format_tasks(state.tasks)
+
+        return _PROMPT.format(
+            project_name=project_dir.name,
+            task_list=task_list,
+        )
+
     def _format_tasks(self, tasks) -> str:
         """Format tasks for prompt."""
-        lines = []
-        for task in tasks:
-            lines.append(f"### {task.id}: {task.title}")
-            lines.append(f"Type: {task.type.value}")
-            lines.append(f"Dependencies: {len(task.dependencies)}")
-            lines.append(f"Description: {task.description[:300]}...")
-            lines.append("")
-        return "\n".join(lines)
-
-    def parse_output(self, output: str) -> DecompositionPlan:
+        return "\n".join(
+            f"### {t.id}: {t.title}\nType: {t.type.value}\n"
+            f"Dependencies: {len(t.dependencies)}\nDescription: {t.description[:300]}...\n"
+            for t in tasks
+        )
+
+    def parse_output(self, output: str | bytes) -> DecompositionPlan:
         """Parse agent output into structured result."""
         try:
-            data = json.loads(output)
-
-            # Validate required fields
-            if "findings" not in data:
-                raise ValueError("Missing 'findings' field")
-
-            findings = [OptimizationFinding.from_dict(f) for f in data["findings"]]
+            data, findings = decode_agent_output(output)
 
             return DecompositionPlan(
                 task_id=data.get("task_id", "unknown"),
@@ -3,10 +3,19 @@
 from dataclasses import dataclass, field
 from typing import Literal
 from pathlib import Path
+import io
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-@dataclass
+# Severity / priority levels, most urgent first
+_LEVELS = ("critical", "high", "medium", "low")
+
+
+@dataclass(slots=True, frozen=True)
 class OptimizationFinding:
     """A single optimization finding from an agent.
 
@@ -35,6 +44,12 @@ class OptimizationFinding:
     evidence: list[str]
     suggested_action: str
 
+    # Field names in constructor order, for positional from_dict
+    _FIELDS = (
+        "finding_id", "task_id", "category", "severity",
+        "description", "evidence", "suggested_action",
+    )
+
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
         return {
@@ -50,15 +65,7 @@ class OptimizationFinding:
     @classmethod
     def from_dict(cls, data: dict) -> "OptimizationFinding":
         """Deserialize from dictionary."""
-        return cls(
-            finding_id=data["finding_id"],
-            task_id=data["task_id"],
-            category=data["category"],
-            severity=data["severity"],
-            description=data["description"],
-            evidence=data["evidence"],
-            suggested_action=data["suggested_action"]
-        )
+        return cls(*map(data.__getitem__, cls._FIELDS))
 
 
 @dataclass
@@ -93,6 +100,12 @@ class OptimizationAction:
     estimated_effort: str
     priority: Literal["critical", "high", "medium", "low"]
 
+    # Field names in constructor order, for positional from_dict
+    _FIELDS = (
+        "action_id", "action_type", "target_task_id", "description",
+        "rationale", "addresses_findings", "estimated_effort", "priority",
+    )
+
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
         return {
@@ -109,16 +122,7 @@ class OptimizationAction:
     @classmethod
     def from_dict(cls, data: dict) -> "OptimizationAction":
         """Deserialize from dictionary."""
-        return cls(
-            action_id=data["action_id"],
-            action_type=data["action_type"],
-            target_task_id=data["target_task_id"],
-            description=data["description"],
-            rationale=data["rationale"],
-            addresses_findings=data["addresses_findings"],
-            estimated_effort=data["estimated_effort"],
-            priority=data["priority"]
-        )
+        return cls(*map(data.__getitem__, cls._FIELDS))
 
 
 @dataclass
@@ -165,6 +169,9 @@ class OptimizationPlan:
     def save(self, output_dir: Path) -> tuple[Path, Path]:
         """Save plan to JSON and markdown files.
 
+        With orjson installed the dataclass tree is serialized natively;
+        its field names match ``to_dict()`` exactly.
+
         Args:
             output_dir: Directory to save files
 
@@ -176,13 +183,16 @@ class OptimizationPlan:
 
         # Save JSON
         json_path = output_dir / "optimization_plan.json"
-        with open(json_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(self, option=orjson.OPT_INDENT_2)
+        else:
+            # json.dumps, not json.dump: one write instead of one per token
+            payload = json.dumps(self.to_dict(), indent=2).encode()
+        json_path.write_bytes(payload)
 
         # Save markdown
         markdown_path = output_dir / "optimization_plan.md"
-        with open(markdown_path, "w") as f:
-            f.write(self._generate_markdown())
+        markdown_path.write_text(self._generate_markdown())
 
         return json_path, markdown_path
 
@@ -196,89 +206,73 @@ class OptimizationPlan:
         Returns:
             OptimizationPlan instance
         """
-        with open(json_path) as f:
-            data = json.load(f)
+        json_path = Path(json_path)
+        if orjson is not None:
+            data = orjson.loads(json_path.read_bytes())
+        else:
+            with open(json_path) as f:
+                data = json.load(f)
         return cls.from_dict(data)
 
     def _generate_markdown(self) -> str:
         """Generate human-readable markdown report."""
-        lines = [
-            f"# Optimization Plan: {self.project_id}",
-            f"",
-            f"**Generated:** {self.timestamp}",
-            f"",
-            f"## Summary",
-            f"",
-            self.summary,
-            f"",
-            f"## Findings ({len(self.findings)} total)",
-            f""
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"# Optimization Plan: {self.project_id}\n\n"
+            f"**Generated:** {self.timestamp}\n\n"
+            f"## Summary\n\n{self.summary}\n\n"
+            f"## Findings ({len(self.findings)} total)\n\n"
+        )
 
         # Group findings by severity
-        by_severity = {
-            "critical": [],
-            "high": [],
-            "medium": [],
-            "low": []
-        }
+        by_severity = {level: [] for level in _LEVELS}
         for finding in self.findings:
             by_severity[finding.severity].append(finding)
 
-        for severity in ["critical", "high", "medium", "low"]:
+        for severity in _LEVELS:
             findings_list = by_severity[severity]
             if findings_list:
-                lines.append(f"### {severity.upper()} ({len(findings_list)})")
-                lines.append("")
+                w(f"### {severity.upper()} ({len(findings_list)})\n\n")
                 for finding in findings_list:
-                    lines.append(f"**{finding.finding_id}** - {finding.category}")
-                    lines.append(f"- Task: {finding.task_id}")
-                    lines.append(f"- Description: {finding.description}")
-                    lines.append(f"- Evidence:")
+                    w(
+                        f"**{finding.finding_id}** - {finding.category}\n"
+                        f"- Task: {finding.task_id}\n"
+                        f"- Description: {finding.description}\n"
+                        f"- Evidence:\n"
+                    )
                     for evidence in finding.evidence:
-                        lines.append(f"  - {evidence}")
-                    lines.append(f"- Suggested Action: {finding.suggested_action}")
-                    lines.append("")
+                        w(f"  - {evidence}\n")
+                    w(f"- Suggested Action: {finding.suggested_action}\n\n")
 
-        lines.extend([
-            f"## Proposed Actions ({len(self.actions)} total)",
-            f""
-        ])
+        w(f"## Proposed Actions ({len(self.actions)} total)\n\n")
 
         # Group actions by priority
-        by_priority = {
-            "critical": [],
-            "high": [],
-            "medium": [],
-            "low": []
-        }
+        by_priority = {level: [] for level in _LEVELS}
         for action in self.actions:
             by_priority[action.priority].append(action)
 
-        for priority in ["critical", "high", "medium", "low"]:
+        for priority in _LEVELS:
             actions_list = by_priority[priority]
             if actions_list:
-                lines.append(f"### {priority.upper()} ({len(actions_list)})")
-                lines.append("")
+                w(f"### {priority.upper()} ({len(actions_list)})\n\n")
                 for action in actions_list:
-                    lines.append(f"**{action.action_id}** - {action.action_type}")
-                    lines.append(f"- Target Task: {action.target_task_id}")
-                    lines.append(f"- Description: {action.description}")
-                    lines.append(f"- Rationale: {action.rationale}")
-                    lines.append(f"- Addresses Findings: {', '.join(action.addresses_findings)}")
-                    lines.append(f"- Estimated Effort: {action.estimated_effort}")
-                    lines.append("")
+                    w(
+                        f"**{action.action_id}** - {action.action_type}\n"
+                        f"- Target Task: {action.target_task_id}\n"
+                        f"- Description: {action.description}\n"
+                        f"- Rationale: {action.rationale}\n"
+                        f"- Addresses Findings: {', '.join(action.addresses_findings)}\n"
+                        f"- Estimated Effort: {action.estimated_effort}\n\n"
+                    )
 
         if self.conflicts:
-            lines.extend([
-                f"## Conflicts ({len(self.conflicts)})",
-                ""
-            ])
+            w(f"## Conflicts ({len(self.conflicts)})\n\n")
             for conflict in self.conflicts:
-                lines.append(f"- {conflict}")
-                lines.append("")
+                w(f"- {conflict}\n\n")
 
-        return "\n".join(lines)
+        # Every line above ends in a newline; the report itself does not
+        return buf.getvalue()[:-1]
 
 
 @dataclass
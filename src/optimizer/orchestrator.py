@@ -1,34 +1,58 @@
 """ProjectOptimizer orchestrator for coordinating optimization agents."""
 import json
 import logging
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from operator import attrgetter
+from typing import Any, Callable, Protocol
 
-from src.state import ProjectState
+from src.state import ProjectState, Task
 from src.optimizer.models import (
     OptimizationFinding,
     OptimizationAction,
     OptimizationPlan,
     OptimizationResult,
+    _LEVELS,
 )
 from src.optimizer.agent_registry import AgentRegistry
 
 logger = logging.getLogger(__name__)
 
+# Categories that conflict with a scope_creep finding on the same task
+_DELIVERABLE_GAPS = frozenset({"test_gap", "doc_gap", "deliverable_unclear"})
+
+# Finding category -> (action type, estimated effort, description builder)
+_ACTION_SPECS: dict[str, tuple[str, str, Callable[[OptimizationFinding], str]]] = {
+    "test_gap": ("add_tests", "1-2 days", attrgetter("suggested_action")),
+    "doc_gap": ("add_docs", "1-2 days", attrgetter("suggested_action")),
+    "scope_creep": (
+        "split_task", "2-3 days", lambda f: f"Decompose {f.task_id} into subtasks",
+    ),
+    "deliverable_unclear": (
+        "clarify_deliverable", "1 day", attrgetter("suggested_action"),
+    ),
+}
+
 
 class AgentInvoker(Protocol):
     """Protocol for agent invocation strategies."""
 
-    def __call__(self, prompt: str, agent_name: str) -> str:
-        """Invoke an agent with the given prompt and return raw output."""
+    def __call__(self, prompt: str, agent_name: str) -> str | bytes:
+        """Invoke an agent with the given prompt and return raw output.
+
+        Raw bytes are passed to the agent's parser undecoded.
+        """
         ...
 
 
-def mock_invoker(_prompt: str, _agent_name: str) -> str:
+_MOCK_OUTPUT = json.dumps({"task_id": "mock", "findings": []}).encode()
+
+
+def mock_invoker(_prompt: str, _agent_name: str) -> bytes:
     """Default mock invoker that returns empty findings."""
-    return json.dumps({"task_id": "mock", "findings": []})
+    return _MOCK_OUTPUT
 
 
 @dataclass
@@ -48,13 +72,13 @@ class ProjectOptimizer:
         self.state = self._load_state()
         self.agent_registry = AgentRegistry()
         self._invoker = invoker or mock_invoker
-
-        # Register agents
-        from src.optimizer.agents.deliverable_analyzer import DeliverableAnalyzer
-        from src.optimizer.agents.task_decomposer import TaskDecomposer
-
-        self.agent_registry.register("deliverable-analyzer", DeliverableAnalyzer())
-        self.agent_registry.register("task-decomposer", TaskDecomposer())
+        # id -> Task, and every id prefix that ends before a "-" (i.e. ids
+        # that already have subtasks); built once per plan execution
+        self._task_index: dict[str, Task] | None = None
+        self._split_parents: set[str] = set()
+        # Lowest OPT-NNN number that may still be free; ids only accumulate,
+        # so numbers below it never need rechecking
+        self._opt_counter = 1
 
     def _load_state(self) -> ProjectState:
         """Load project state from file."""
@@ -144,92 +168,61 @@ class ProjectOptimizer:
 
     def _merge_findings(self, agent_results: dict[str, Any]) -> list[OptimizationFinding]:
         """Merge findings from all agents."""
-        all_findings = []
+        # Bucket by severity: a stable sort over four known keys
+        buckets = {level: [] for level in _LEVELS}
+        other = []
         for _agent_name, result in agent_results.items():
             if result and hasattr(result, 'findings'):
-                all_findings.extend(result.findings)
-
-        # Sort by severity
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        all_findings.sort(key=lambda f: severity_order.get(f.severity, 4))
+                for finding in result.findings:
+                    buckets.get(finding.severity, other).append(finding)
 
+        all_findings = []
+        for level in _LEVELS:
+            all_findings.extend(buckets[level])
+        all_findings.extend(other)
         return all_findings
 
     def _detect_conflicts(self, findings: list[OptimizationFinding]) -> list[str]:
         """Detect conflicting recommendations."""
-        conflicts = []
-        task_findings = {}
-
-        # Group findings by task
+        # Group finding categories by task, in first-seen task order
+        task_categories: defaultdict[str, set[str]] = defaultdict(set)
         for finding in findings:
-            if finding.task_id not in task_findings:
-                task_findings[finding.task_id] = []
-            task_findings[finding.task_id].append(finding)
-
-        # Check for conflicts
-        for task_id, task_findings_list in task_findings.items():
-            if len(task_findings_list) > 1:
-                categories = [f.category for f in task_findings_list]
-                if "scope_creep" in categories and any(
-                    c in ["test_gap", "doc_gap", "deliverable_unclear"] for c in categories
-                ):
-                    conflicts.append(
-                        f"Task {task_id}: Decomposition suggested but also has missing deliverables. "
-                        f"Recommend: Approve decomposition first, then re-run to analyze subtasks."
-                    )
+            task_categories[finding.task_id].add(finding.category)
+
+        conflicts = []
+        for task_id, categories in task_categories.items():
+            if "scope_creep" in categories and not categories.isdisjoint(_DELIVERABLE_GAPS):
+                conflicts.append(
+                    f"Task {task_id}: Decomposition suggested but also has missing deliverables. "
+                    f"Recommend: Approve decomposition first, then re-run to analyze subtasks."
+                )
 
         return conflicts
 
     def _generate_actions(self, findings: list[OptimizationFinding]) -> list[OptimizationAction]:
         """Convert findings to executable actions."""
         actions = []
-        action_counter = 1
 
         for finding in findings:
-            if finding.category in ["test_gap", "doc_gap"]:
-                actions.append(OptimizationAction(
-                    action_id=f"action-{action_counter}",
-                    action_type="add_tests" if finding.category == "test_gap" else "add_docs",
-                    target_task_id=finding.task_id,
-                    description=finding.suggested_action[:500],
-                    rationale=finding.description[:500],
-                    addresses_findings=[finding.finding_id],
-                    estimated_effort="1-2 days",
-                    priority=finding.severity
-                ))
-                action_counter += 1
-
-            elif finding.category == "scope_creep":
-                actions.append(OptimizationAction(
-                    action_id=f"action-{action_counter}",
-                    action_type="split_task",
-                    target_task_id=finding.task_id,
-                    description=f"Decompose {finding.task_id} into subtasks",
-                    rationale=finding.description[:500],
-                    addresses_findings=[finding.finding_id],
-                    estimated_effort="2-3 days",
-                    priority=finding.severity
-                ))
-                action_counter += 1
-
-            elif finding.category == "deliverable_unclear":
-                actions.append(OptimizationAction(
-                    action_id=f"action-{action_counter}",
-                    action_type="clarify_deliverable",
-                    target_task_id=finding.task_id,
-                    description=finding.suggested_action[:500],
-                    rationale=finding.description[:500],
-                    addresses_findings=[finding.finding_id],
-                    estimated_effort="1 day",
-                    priority=finding.severity
-                ))
-                action_counter += 1
-
-            else:
+            spec = _ACTION_SPECS.get(finding.category)
+            if spec is None:
                 logger.warning(
                     f"No action handler for finding category '{finding.category}' "
                     f"(finding {finding.finding_id}, task {finding.task_id})"
                 )
+                continue
+
+            action_type, effort, describe = spec
+            actions.append(OptimizationAction(
+                action_id=f"action-{len(actions) + 1}",
+                action_type=action_type,
+                target_task_id=finding.task_id,
+                description=describe(finding)[:500],
+                rationale=finding.description[:500],
+                addresses_findings=[finding.finding_id],
+                estimated_effort=effort,
+                priority=finding.severity
+            ))
 
         return actions
 
@@ -261,8 +254,10 @@ class ProjectOptimizer:
 
         # Backup state before execution
         self._backup_state()
+        self._index_tasks()
 
         changes_made = []
+        executed = 0
         success = True
 
         for action in plan.actions:
@@ -272,6 +267,7 @@ class ProjectOptimizer:
             try:
                 self._execute_action(action)
                 changes_made.append(f"Executed {action.action_id}: {action.description}")
+                executed += 1
                 logger.info(f"Executed action: {action.action_id}")
             except Exception as e:
                 changes_made.append(f"Failed {action.action_id}: {str(e)}")
@@ -287,7 +283,7 @@ class ProjectOptimizer:
         result = OptimizationResult(
             action_id=f"plan-{plan.project_id}",
             success=success,
-            message=f"Executed {len([c for c in changes_made if 'Executed' in c])} actions",
+            message=f"Executed {executed} actions",
             changes_made=changes_made
         )
 
@@ -307,8 +303,38 @@ class ProjectOptimizer:
             shutil.copy(state_path, backup_path)
             logger.info(f"Created state backup: {backup_path}")
 
+    def _index_tasks(self) -> None:
+        """(Re)build the task lookups used while executing actions."""
+        self._task_index = {}
+        self._split_parents = set()
+        self._opt_counter = 1
+        for task in self.state.tasks:
+            self._index_task(task)
+
+    def _index_task(self, task: Task) -> None:
+        self._task_index[task.id] = task
+        task_id = task.id
+        pos = task_id.find("-")
+        while pos != -1:
+            self._split_parents.add(task_id[:pos])
+            pos = task_id.find("-", pos + 1)
+
+    def _add_task(self, task: Task) -> None:
+        """Append a task to the project, keeping the lookups current."""
+        self.state.tasks.append(task)
+        self._index_task(task)
+
+    def _next_opt_id(self) -> str:
+        """Return the lowest unused OPT-NNN task id."""
+        while f"OPT-{self._opt_counter:03d}" in self._task_index:
+            self._opt_counter += 1
+        return f"OPT-{self._opt_counter:03d}"
+
     def _execute_action(self, action: OptimizationAction) -> None:
         """Execute a single action based on type."""
+        if self._task_index is None:
+            self._index_tasks()
+
         # Validate before executing
         is_valid, error_msg = self._validate_action(action)
         if not is_valid:
@@ -328,30 +354,25 @@ class ProjectOptimizer:
     def _validate_action(self, action: OptimizationAction) -> tuple[bool, str]:
         """Validate action before execution."""
         # Check target task exists
-        if not any(t.id == action.target_task_id for t in self.state.tasks):
+        if action.target_task_id not in self._task_index:
             return False, f"Target task {action.target_task_id} not found"
 
         if action.action_type == "split_task":
             # Check task isn't already split
             parent_id = action.target_task_id
-            if any(t.id.startswith(f"{parent_id}-") for t in self.state.tasks):
+            if parent_id in self._split_parents:
                 return False, f"Task {parent_id} already has subtasks"
 
         return True, ""
 
     def _execute_add_tests(self, action: OptimizationAction) -> None:
         """Execute add_tests action."""
-        from src.state import Task, Layer, TaskType, Scope
+        from src.state import Layer, TaskType, Scope
 
-        # Generate new task ID
-        existing_ids = [t.id for t in self.state.tasks]
-        task_counter = 1
-        while f"OPT-{task_counter:03d}" in existing_ids:
-            task_counter += 1
-        new_id = f"OPT-{task_counter:03d}"
+        new_id = self._next_opt_id()
 
         # Get target task to inherit properties
-        target_task = next((t for t in self.state.tasks if t.id == action.target_task_id), None)
+        target_task = self._task_index.get(action.target_task_id)
 
         # Create new test task
         new_task = Task(
@@ -367,22 +388,17 @@ class ProjectOptimizer:
             specialist="test-engineer"
         )
 
-        self.state.tasks.append(new_task)
+        self._add_task(new_task)
         logger.info(f"Added test task: {new_id}")
 
     def _execute_add_docs(self, action: OptimizationAction) -> None:
         """Execute add_docs action."""
-        from src.state import Task, Layer, TaskType, Scope
+        from src.state import Layer, TaskType, Scope
 
-        # Generate new task ID
-        existing_ids = [t.id for t in self.state.tasks]
-        task_counter = 1
-        while f"OPT-{task_counter:03d}" in existing_ids:
-            task_counter += 1
-        new_id = f"OPT-{task_counter:03d}"
+        new_id = self._next_opt_id()
 
         # Get target task to inherit properties
-        target_task = next((t for t in self.state.tasks if t.id == action.target_task_id), None)
+        target_task = self._task_index.get(action.target_task_id)
 
         # Create new documentation task
         new_task = Task(
@@ -398,15 +414,14 @@ class ProjectOptimizer:
             specialist="tech-writer"
         )
 
-        self.state.tasks.append(new_task)
+        self._add_task(new_task)
         logger.info(f"Added documentation task: {new_id}")
 
     def _execute_split_task(self, action: OptimizationAction) -> None:
         """Execute split_task action."""
-        from src.state import Task
 
         parent_id = action.target_task_id
-        parent_task = next((t for t in self.state.tasks if t.id == parent_id), None)
+        parent_task = self._task_index.get(parent_id)
 
         if not parent_task:
             raise ValueError(f"Parent task {parent_id} not found")
@@ -433,14 +448,14 @@ class ProjectOptimizer:
                 specialist=parent_task.specialist
             )
 
-            self.state.tasks.append(subtask)
+            self._add_task(subtask)
 
         logger.info(f"Split {parent_id} into {len(subtasks_data)} subtasks")
 
     def _execute_clarify_deliverable(self, action: OptimizationAction) -> None:
         """Execute clarify_deliverable action."""
         # Find target task and update its description
-        target_task = next((t for t in self.state.tasks if t.id == action.target_task_id), None)
+        target_task = self._task_index.get(action.target_task_id)
         if target_task:
             # Append clarification to description
             target_task.description += f"\n\nClarification: {action.description}"
@@ -122,6 +122,9 @@ def _run_sequential(
     state_mgr: StateManager | None = None,
 ) -> ProjectState:
     """Original sequential loop for backward compatibility."""
+    from src.brainstorm import DeferralIndex, check_deferred_triggers
+    deferrals = DeferralIndex.build(state)
+
     while True:
         task = select_next_task(state)
 
@@ -154,8 +157,7 @@ def _run_sequential(
         _checkpoint(state_mgr, f"task_{task.id}_done")
 
         # Check deferred triggers
-        from src.brainstorm import check_deferred_triggers
-        promoted = check_deferred_triggers(state, task.id)
+        promoted = check_deferred_triggers(state, task.id, index=deferrals)
         if promoted:
             _checkpoint(state_mgr, f"deferred_promoted_{','.join(promoted)}")
 
@@ -176,7 +178,9 @@ def _run_parallel(
     state_mgr: StateManager | None = None,
 ) -> ProjectState:
     """Parallel batch execution with per-task review."""
+    from src.brainstorm import DeferralIndex, check_deferred_triggers
     scheduler = TaskScheduler(state.tasks)
+    deferrals = DeferralIndex.build(state)
 
     while not scheduler.all_done():
         batch = scheduler.get_ready_batch()
@@ -242,8 +246,7 @@ def _run_parallel(
             _checkpoint(state_mgr, f"task_{task.id}_done")
 
             # Check deferred triggers
-            from src.brainstorm import check_deferred_triggers
-            promoted = check_deferred_triggers(state, task.id)
+            promoted = check_deferred_triggers(state, task.id, index=deferrals)
             if promoted:
                 _checkpoint(state_mgr, f"deferred_promoted_{','.join(promoted)}")
 
@@ -10,6 +10,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 @dataclass
 class CapabilityRegistry:
@@ -19,7 +24,7 @@ class CapabilityRegistry:
     def load(cls, path: str) -> CapabilityRegistry:
         """Load registry from YAML file."""
         with open(path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=SafeLoader) or {}
         return cls(components=data)
 
     def has(self, component: str, category: str, value: str) -> bool:
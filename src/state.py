@@ -11,6 +11,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 # -- Enums -----------------------------------------------------------------
 
@@ -108,6 +113,26 @@ class TaskStatus(Enum):
     TERMINATED = "terminated"
 
 
+# Direct value -> member maps; a dict hit skips EnumType.__call__ dispatch
+_LAYER_BY_VALUE = Layer._value2member_map_
+_TASK_TYPE_BY_VALUE = TaskType._value2member_map_
+_SCOPE_BY_VALUE = Scope._value2member_map_
+_GATE_TYPE_BY_VALUE = GateType._value2member_map_
+_TASK_STATUS_BY_VALUE = TaskStatus._value2member_map_
+
+# Legacy/unknown task type values mapped to valid TaskType values
+_LEGACY_TYPE_MAP = {
+    "workflow": "integration",
+    "port": "extend",
+}
+
+
+def _enum_from_value(by_value: dict[Any, Enum], enum_cls: type[Enum], raw: Any) -> Any:
+    """Look up an enum member by value, deferring to enum_cls for errors."""
+    member = by_value.get(raw)
+    return member if member is not None else enum_cls(raw)
+
+
 # -- Dataclasses -----------------------------------------------------------
 
 
@@ -165,13 +190,12 @@ class Task:
     @classmethod
     def _parse_task_type(cls, raw: str) -> TaskType:
         """Parse task type with migration for legacy formats."""
+        member = _TASK_TYPE_BY_VALUE.get(raw)
+        if member is not None:
+            return member
         # Handle uppercase legacy values (e.g. "ALGORITHM" -> "algorithm")
         normalized = raw.lower()
         # Map legacy/unknown values to valid TaskType
-        _LEGACY_TYPE_MAP = {
-            "workflow": "integration",
-            "port": "extend",
-        }
         normalized = _LEGACY_TYPE_MAP.get(normalized, normalized)
         return TaskType(normalized)
 
@@ -180,16 +204,23 @@ class Task:
         return cls(
             id=data["id"],
             title=data["title"],
-            layer=Layer(data["layer"]),
+            layer=_enum_from_value(_LAYER_BY_VALUE, Layer, data["layer"]),
             type=cls._parse_task_type(data["type"]),
             description=data["description"],
             dependencies=data["dependencies"],
             acceptance_criteria=data["acceptance_criteria"],
             files_to_touch=data["files_to_touch"],
-            estimated_scope=Scope(data.get("estimated_scope", "medium")),
+            estimated_scope=_enum_from_value(
+                _SCOPE_BY_VALUE, Scope, data.get("estimated_scope", "medium")
+            ),
             specialist=data["specialist"],
-            gates=[GateType(g) for g in data.get("gates", [])],
-            status=TaskStatus(data.get("status", "pending")),
+            gates=[
+                _enum_from_value(_GATE_TYPE_BY_VALUE, GateType, g)
+                for g in data.get("gates", [])
+            ],
+            status=_enum_from_value(
+                _TASK_STATUS_BY_VALUE, TaskStatus, data.get("status", "pending")
+            ),
             branch_name=data.get("branch_name", ""),
             commit_hash=data.get("commit_hash", ""),
             worktree_path=data.get("worktree_path", ""),
@@ -239,6 +270,21 @@ class Draft:
     explanation: str
     commit_hash: str = ""
     branch_name: str = ""
+    # Memoized by total_lines; underscore keeps it out of orjson output
+    _total_lines: int | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    @property
+    def total_lines(self) -> int:
+        """Line count across files and test files, computed once per draft."""
+        if self._total_lines is None:
+            self._total_lines = sum(
+                content.count("\n")
+                for files in (self.files, self.test_files)
+                for content in files.values()
+            )
+        return self._total_lines
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -381,7 +427,7 @@ class IntegrationTest:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewResult:
     """Result of an AI review check at a hook point."""
     hook_name: str
@@ -407,7 +453,7 @@ class ReviewResult:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HumanApproval:
     """Record of a human approval/rejection at a hook point."""
     hook_name: str
@@ -570,14 +616,28 @@ class ProjectState:
         )
 
     def save(self, path: str | Path) -> None:
-        """Persist state to a JSON file."""
+        """Persist state to a JSON file.
+
+        With orjson installed the dataclass tree is serialized natively;
+        its field names and enum values match ``to_dict()`` exactly.
+        """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        if orjson is not None:
+            path.write_bytes(
+                orjson.dumps(
+                    self, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+        else:
+            path.write_text(json.dumps(self.to_dict(), indent=2))
 
     @classmethod
     def load(cls, path: str | Path) -> ProjectState:
         """Load state from a JSON file."""
         path = Path(path)
-        data = json.loads(path.read_text())
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_text())
         return cls.from_dict(data)
@@ -11,6 +11,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from src.state import Task
 
 
@@ -34,7 +39,7 @@ class WorktreeManager:
     def _load_repo_map(self, capabilities_path: str) -> None:
         """Load component -> repo path mapping from capabilities.yaml."""
         with open(capabilities_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=SafeLoader) or {}
         for component, info in data.items():
             if isinstance(info, dict) and "source_path" in info:
                 self._repo_map[component] = Path(info["source_path"])
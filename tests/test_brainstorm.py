@@ -10,6 +10,7 @@ import pytest
 
 from src.brainstorm import (
     BrainstormQuestion,
+    DeferralIndex,
     apply_brainstorm_decisions,
     check_deferred_triggers,
     defer_task,
@@ -101,6 +102,18 @@ class TestCheckExternalDependency:
         )
         assert len(qs) == 1
 
+    def test_reports_first_keyword_in_list_order(self):
+        tasks = [_make_task("T1", title="Optimize then generate", description="x")]
+        qs = flag_risky_tasks(_make_state(tasks), checks=["external_dependency"])
+        assert qs[0].risk_reason == "external_dependency: matches keyword 'generate'"
+
+    def test_keywords_are_matched_literally(self):
+        tasks = [_make_task("T1", title="Tune a+b solver")]
+        qs = flag_risky_tasks(
+            _make_state(tasks), checks=["external_dependency"], keywords=["A+B"],
+        )
+        assert len(qs) == 1
+
     def test_skips_non_pending(self):
         tasks = [_make_task("T1", title="Generate data", status=TaskStatus.DONE)]
         qs = flag_risky_tasks(_make_state(tasks), checks=["external_dependency"])
@@ -150,6 +163,23 @@ class TestCheckLongCriticalPath:
         )
         assert len(qs) == 0
 
+    def test_first_match_only_stops_at_first_reason(self):
+        tasks = [
+            _make_task("T1", title="Generate data"),
+            _make_task("T2", deps=["T1"]),
+            _make_task("T3", deps=["T1"]),
+            _make_task("T4", deps=["T1"]),
+        ]
+        checks = ["external_dependency", "long_critical_path"]
+        qs = flag_risky_tasks(_make_state(tasks), checks=checks)
+        assert qs[0].risk_reason.count(";") == 1
+        assert qs[0].blocks_count == 3
+
+        qs = flag_risky_tasks(_make_state(tasks), checks=checks, first_match_only=True)
+        assert qs[0].risk_reason.startswith("external_dependency")
+        assert ";" not in qs[0].risk_reason
+        assert qs[0].blocks_count == 3
+
 
 # -- Transitive dependents ---------------------------------------------------
 
@@ -176,6 +206,13 @@ class TestFindTransitiveDependents:
         tasks = [_make_task("A"), _make_task("B")]
         assert find_transitive_dependents("A", tasks) == set()
 
+    def test_prebuilt_dependents_map(self):
+        # The map is used as-is; the task list is not rescanned
+        dependents_map = {"A": ["B"], "B": ["C"]}
+        assert find_transitive_dependents(
+            "A", [], dependents_map=dependents_map,
+        ) == {"B", "C"}
+
 
 # -- Defer tests --------------------------------------------------------------
 
@@ -471,6 +508,22 @@ class TestApplyDecisions:
         remaining_ids = [t.id for t in state.tasks]
         assert "T3" not in remaining_ids
 
+    def test_later_decisions_see_earlier_splits_and_drops(self):
+        state = _make_state([_make_task("T1"), _make_task("T2")])
+        decisions = [
+            {"task_id": "T1", "action": "split", "trigger": "X:done"},
+            {"task_id": "T1-safe", "action": "terminate", "notes": "n/a"},
+            {"task_id": "T2", "action": "drop"},
+            {"task_id": "T2", "action": "defer", "trigger": "X:done"},
+        ]
+        results = apply_brainstorm_decisions(state, decisions)
+        statuses = {t.id: t.status for t in state.tasks}
+        assert statuses == {
+            "T1-safe": TaskStatus.TERMINATED,
+            "T1-defer": TaskStatus.DEFERRED,
+        }
+        assert results[3].action_taken == "deferred 0 tasks: []"
+
     def test_produces_brainstorm_results(self):
         state = _make_state([_make_task("T1")])
         decisions = [{"task_id": "T1", "action": "keep", "notes": "looks fine"}]
@@ -521,6 +574,25 @@ class TestDeferredTriggers:
         assert promoted == []
         assert state.tasks[1].status == TaskStatus.DEFERRED
 
+    def test_shared_index_across_completions(self):
+        tasks = [
+            _make_task("T1", status=TaskStatus.DONE),
+            _make_task("T2", status=TaskStatus.DONE),
+            _make_task("T3", status=TaskStatus.DEFERRED),
+            _make_task("T4", status=TaskStatus.DEFERRED),
+        ]
+        tasks[2].defer_trigger = "T1:done"
+        tasks[3].defer_trigger = "T2:done"
+        state = _make_state(tasks)
+        index = DeferralIndex.build(state)
+        assert sorted(index.by_trigger) == ["T1", "T2"]
+
+        assert check_deferred_triggers(state, "T1", index=index) == ["T3"]
+        assert "T1" not in index.by_trigger
+        assert check_deferred_triggers(state, "T1", index=index) == []
+        assert check_deferred_triggers(state, "T2", index=index) == ["T4"]
+        assert index.by_trigger == {}
+
 
 # -- run_brainstorm integration tests -----------------------------------------
 
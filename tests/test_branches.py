@@ -1,5 +1,7 @@
 """Tests for branch tracking registry."""
 
+import dataclasses
+
 import yaml
 import pytest
 
@@ -45,6 +47,12 @@ class TestBranchEntry:
         entry = BranchEntry.from_dict(data)
         assert entry.status == "in_progress"
 
+    def test_entry_is_frozen_and_slotted(self):
+        entry = _make_entry()
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.status = "merged"
+
 
 # ── BranchRegistry.load ────────────────────────────────────────────
 
@@ -95,6 +103,24 @@ class TestBranchRegistryLoad:
         assert reg.branches["abacus"][0].branch == "feat/neb"
         assert reg.branches["deepmd-kit"][0].status == "ready_to_merge"
 
+    def test_reload_after_save_sees_changes(self, tmp_path):
+        """Cached parses never leak mutations and are dropped on save."""
+        p = tmp_path / "branches.yaml"
+        reg = BranchRegistry(_path=str(p))
+        reg.register_branch("abacus", _make_entry(branch="feat/neb"))
+        reg.save()
+
+        first = BranchRegistry.load(str(p))
+        first.branches["abacus"][0].target_capabilities.append("leaked")
+        first.register_branch("abacus", _make_entry(branch="feat/mlp"))
+        second = BranchRegistry.load(str(p))
+        assert [e.branch for e in second.branches["abacus"]] == ["feat/neb"]
+        assert "leaked" not in second.branches["abacus"][0].target_capabilities
+
+        first.save()
+        third = BranchRegistry.load(str(p))
+        assert [e.branch for e in third.branches["abacus"]] == ["feat/neb", "feat/mlp"]
+
 
 # ── register_branch / get_branches / get_in_progress ───────────────
 
@@ -175,6 +201,52 @@ class TestHasInProgress:
         )
         assert reg.has_in_progress("NEB") is False
 
+    def test_reflects_register_and_merge(self):
+        reg = BranchRegistry()
+        assert reg.has_in_progress("NEB") is False
+        reg.register_branch(
+            "abacus",
+            _make_entry(branch="feat/neb", target_capabilities=["NEB workflow"]),
+        )
+        assert reg.has_in_progress("neb work") is True
+        reg.merge_branch("abacus", "feat/neb")
+        assert reg.has_in_progress("NEB") is False
+
+    def test_keyword_does_not_span_capabilities(self):
+        reg = BranchRegistry()
+        reg.register_branch(
+            "abacus", _make_entry(target_capabilities=["NEB", "workflow"]),
+        )
+        assert reg.has_in_progress("nebworkflow") is False
+
+    def test_editing_get_branches_result_leaves_registry_unchanged(self):
+        reg = BranchRegistry()
+        reg.register_branch("abacus", _make_entry(target_capabilities=["NEB workflow"]))
+        assert reg.has_in_progress("NEB") is True
+
+        reg.get_branches("abacus").clear()
+        reg.get_branches("deepmd-kit").append(
+            _make_entry(target_capabilities=["TDDFT"]),
+        )
+
+        assert len(reg.get_branches("abacus")) == 1
+        assert reg.get_branches("deepmd-kit") == []
+        assert reg.has_in_progress("NEB") is True
+        assert reg.has_in_progress("TDDFT") is False
+
+    def test_direct_edits_to_branches_are_not_indexed(self):
+        # Documented restriction: only register_branch / merge_branch
+        # reset the index that has_in_progress answers from
+        reg = BranchRegistry()
+        reg.register_branch("abacus", _make_entry(target_capabilities=["NEB workflow"]))
+        assert reg.has_in_progress("TDDFT") is False
+
+        reg.branches["abacus"][0].target_capabilities.append("TDDFT")
+        assert reg.has_in_progress("TDDFT") is False
+
+        reg.register_branch("deepmd-kit", _make_entry(target_capabilities=[]))
+        assert reg.has_in_progress("TDDFT") is True
+
 
 # ── merge_branch ────────────────────────────────────────────────────
 
@@ -238,3 +310,47 @@ class TestSaveLoadRoundtrip:
 
         loaded = BranchRegistry.load(str(p))
         assert len(loaded.branches["abacus"]) == 1
+
+    def test_roundtrip_quotes_ambiguous_strings(self, tmp_path):
+        p = tmp_path / "branches.yaml"
+        reg = BranchRegistry()
+        caps = ["NEB workflow", "yes", "1.5", "a: b", "#tag", " pad ", "", 'q"x', "ü"]
+        reg.register_branch("no", _make_entry(target_capabilities=caps))
+        reg.register_branch("empty", _make_entry(target_capabilities=[]))
+        reg.save(str(p))
+
+        with open(p) as f:
+            raw = yaml.safe_load(f)
+        assert raw == {
+            comp: [e.to_dict() for e in entries]
+            for comp, entries in reg.branches.items()
+        }
+        loaded = BranchRegistry.load(str(p))
+        assert loaded.branches["no"][0].target_capabilities == caps
+        assert loaded.branches["empty"][0].target_capabilities == []
+
+    def test_roundtrip_keeps_non_string_values(self, tmp_path):
+        p = tmp_path / "branches.yaml"
+        p.write_text(
+            "abacus:\n"
+            "- branch: feat/neb\n"
+            "  repo: abacus-develop\n"
+            "  target_capabilities: [NEB workflow, 1.5, true, 7]\n"
+            "  created_by: null\n"
+            "  task_id: 42\n"
+            "  status: false\n"
+            "2024:\n"
+            "- branch: feat/mlp\n"
+            "  repo: deepmd-kit\n"
+            "  target_capabilities: [2024-01-05]\n"
+            "  created_by: human\n"
+            "  task_id: 3.0\n"
+            "  status: in_progress\n"
+        )
+        with open(p) as f:
+            original = yaml.safe_load(f)
+
+        BranchRegistry.load(str(p)).save()
+
+        with open(p) as f:
+            assert yaml.safe_load(f) == original
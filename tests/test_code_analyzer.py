@@ -51,6 +51,15 @@ def test_find_files(tmp_path):
     assert len(py_files) == 3
 
 
+def test_find_files_skips_tool_directories(tmp_path):
+    for d in (".git", "__pycache__", ".venv/lib", "node_modules/pkg", "src"):
+        (tmp_path / d).mkdir(parents=True)
+        (tmp_path / d / "mod.py").write_text("# x")
+
+    analyzer = CodeAnalyzer(str(tmp_path))
+    assert analyzer.find_files("*.py") == [str(tmp_path / "src" / "mod.py")]
+
+
 def test_search_content(tmp_path):
     (tmp_path / "a.py").write_text("def run_neb(): pass\n")
     (tmp_path / "b.py").write_text("# no match here\n")
@@ -84,3 +93,77 @@ def test_extract_interface(tmp_path):
     assert interface["docstring"] == "LCAO basis workflow."
     public = [m for m in interface["methods"] if not m["name"].startswith("_")]
     assert len(public) == 2
+
+
+def test_extract_interface_reindexes_changed_file(tmp_path):
+    py_file = tmp_path / "workflow.py"
+    py_file.write_text("class A:\n    def run(self): pass\nclass B: pass\n")
+    analyzer = CodeAnalyzer(str(tmp_path))
+    assert [m["name"] for m in analyzer.extract_interface(str(py_file), "A")["methods"]] == ["run"]
+    assert analyzer.extract_interface(str(py_file), "B")["methods"] == []
+    assert analyzer.extract_interface(str(py_file), "C")["methods"] == []
+
+    py_file.write_text("class C:\n    def go(self, x): pass\n")
+    os.utime(py_file, ns=(1_000, 1_000))
+    interface = analyzer.extract_interface(str(py_file), "C")
+    assert interface["methods"][0]["args"] == ["x"]
+    assert analyzer.extract_interface(str(py_file), "A")["methods"] == []
+
+
+def test_parsed_trees_are_cached_until_file_changes(tmp_path):
+    py_file = tmp_path / "module.py"
+    py_file.write_text("class FooWorkflow:\n    pass\n")
+    analyzer = CodeAnalyzer(str(tmp_path))
+
+    assert [c["name"] for c in analyzer.find_classes("Workflow")] == ["FooWorkflow"]
+    tree = analyzer._parsed(str(py_file))
+    assert analyzer.find_methods("FooWorkflow") == []
+    assert analyzer._parsed(str(py_file)) is tree
+
+    py_file.write_text("class BarWorkflow:\n    def run(self): pass\n")
+    os.utime(py_file, ns=(1_000, 1_000))
+    assert [c["name"] for c in analyzer.find_classes("Workflow")] == ["BarWorkflow"]
+    assert analyzer._parsed(str(py_file)) is not tree
+
+
+def test_find_classes_in_nested_blocks(tmp_path):
+    (tmp_path / "module.py").write_text(
+        "try:\n"
+        "    class TryWorkflow: pass\n"
+        "except ImportError:\n"
+        "    class ExceptWorkflow: pass\n"
+        "def factory():\n"
+        "    if True:\n"
+        "        class InnerWorkflow:\n"
+        "            class NestedWorkflow: pass\n"
+        "    return InnerWorkflow\n"
+    )
+    analyzer = CodeAnalyzer(str(tmp_path))
+    names = {c["name"] for c in analyzer.find_classes("Workflow")}
+    assert names == {"TryWorkflow", "ExceptWorkflow", "InnerWorkflow", "NestedWorkflow"}
+
+
+def test_search_literal_and_regex(tmp_path):
+    (tmp_path / "a.py").write_text("def run_neb(): pass\n")
+    (tmp_path / "b.py").write_text("x = compute_stress()\n")
+    (tmp_path / "c.py").write_bytes(b"\xff\xfe run_neb\n")
+
+    analyzer = CodeAnalyzer(str(tmp_path))
+    assert [os.path.basename(m["file"]) for m in analyzer.search("run_neb")] == ["a.py"]
+    assert analyzer.search("RUN_NEB") == []
+    assert len(analyzer.search(r"run_\w+|stress\(")) == 2
+
+
+def test_parallel_scan_matches_serial(tmp_path):
+    for i in range(60):
+        (tmp_path / f"mod{i:02d}.py").write_text(
+            f"class Workflow{i}:\n    def run(self, x): pass\n"
+        )
+    (tmp_path / "broken.py").write_text("class (:\n")
+
+    serial = CodeAnalyzer(str(tmp_path))
+    pooled = CodeAnalyzer(str(tmp_path), workers=2)
+    assert pooled.find_classes("Workflow") == serial.find_classes("Workflow")
+    assert pooled.find_methods("Workflow7") == serial.find_methods("Workflow7")
+    assert pooled.search("run") == serial.search("run")
+    assert len(pooled.find_classes("Workflow")) == 60
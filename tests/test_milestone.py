@@ -4,7 +4,9 @@ from datetime import datetime
 
 from src.milestone import (
     MilestoneReview,
+    ProjectIndex,
     check_milestone_gate,
+    run_all_milestones,
     run_milestone_review,
     suggest_rescope,
 )
@@ -134,3 +136,41 @@ class TestRunMilestoneReview:
         assert d["milestone_id"] == "M1"
         assert d["on_track"] is True
         assert d["rescope_suggestions"] == []
+
+
+class TestRunAllMilestones:
+    def _behind_schedule_tasks(self):
+        tasks = [_task("DONE-1", "done")]
+        tasks[0]["completed_at"] = "2026-02-18T00:00:00"
+        for i in range(20):
+            tasks.append(_task(f"P-{i}", "pending", priority_score=10 + i))
+        return tasks
+
+    def test_matches_individual_reviews(self):
+        now = datetime(2026, 2, 19)
+        tasks = self._behind_schedule_tasks()
+        milestones = {"M1": ["DONE-1", "P-0"], "M2": ["P-1", "P-2", "MISSING"]}
+        reviews = run_all_milestones(tasks, milestones, "2026-03-05", as_of=now)
+        expected = [
+            run_milestone_review(tasks, mid, ids, "2026-03-05", as_of=now)
+            for mid, ids in milestones.items()
+        ]
+        assert [r.to_dict() for r in reviews] == [r.to_dict() for r in expected]
+        assert reviews[0].rescope_suggestions[0]["task_id"] == "P-0"
+        assert reviews[1].tasks_covered == 2
+
+    def test_shared_index_forecasts_once(self, monkeypatch):
+        from src import milestone
+
+        calls = []
+        real = milestone.forecast_completion
+        monkeypatch.setattr(
+            milestone, "forecast_completion",
+            lambda *a, **kw: calls.append(1) or real(*a, **kw),
+        )
+        now = datetime(2026, 2, 19)
+        tasks = self._behind_schedule_tasks()
+        index = ProjectIndex(tasks)
+        for mid in ("M1", "M2", "M3"):
+            run_milestone_review(tasks, mid, ["P-0"], "2026-03-05", as_of=now, index=index)
+        assert len(calls) == 1
@@ -110,3 +110,89 @@ def test_execute_plan_with_approved_actions(optimizer_with_state):
 
     assert len(result.changes_made) >= 1
     assert result.success is True
+
+
+def test_execute_plan_rejects_second_split_of_same_task(optimizer_with_state):
+    """Subtasks added during a plan are visible to later actions."""
+    optimizer = optimizer_with_state
+
+    def split(action_id):
+        return OptimizationAction(
+            action_id=action_id,
+            action_type="split_task",
+            target_task_id="TEST-001",
+            description="Decompose TEST-001 into subtasks",
+            rationale="Too large",
+            addresses_findings=[],
+            estimated_effort="2-3 days",
+            priority="medium"
+        )
+
+    clarify = OptimizationAction(
+        action_id="action-3",
+        action_type="clarify_deliverable",
+        target_task_id="TEST-001-1",
+        description="Return the parsed config",
+        rationale="Unclear output",
+        addresses_findings=[],
+        estimated_effort="1 day",
+        priority="low"
+    )
+    plan = OptimizationPlan(
+        project_id="test-project",
+        timestamp="2026-02-15T10:00:00",
+        findings=[],
+        actions=[split("action-1"), split("action-2"), clarify],
+        summary="Test plan"
+    )
+
+    result = optimizer.execute_plan(plan, ["action-1", "action-2", "action-3"])
+
+    assert result.success is False
+    assert [t.id for t in optimizer.state.tasks] == ["TEST-001", "TEST-001-1", "TEST-001-2"]
+    assert "already has subtasks" in result.changes_made[1]
+    assert optimizer.state.tasks[1].description.endswith("Clarification: Return the parsed config")
+
+
+def test_execute_plan_allocates_lowest_free_opt_ids(optimizer_with_state):
+    """New OPT tasks fill gaps first, then keep counting upwards."""
+    optimizer = optimizer_with_state
+    existing = optimizer.state.tasks[0]
+    for task_id in ("OPT-001", "OPT-003"):
+        optimizer.state.tasks.append(Task(
+            id=task_id,
+            title=task_id,
+            description="",
+            layer=existing.layer,
+            type=existing.type,
+            dependencies=[],
+            acceptance_criteria=[],
+            files_to_touch=[],
+            estimated_scope=Scope.SMALL,
+            specialist="python-dev"
+        ))
+
+    actions = [
+        OptimizationAction(
+            action_id=f"action-{i}",
+            action_type=action_type,
+            target_task_id="TEST-001",
+            description="Fill the gap",
+            rationale="Missing",
+            addresses_findings=[],
+            estimated_effort="1 day",
+            priority="medium"
+        )
+        for i, action_type in enumerate(("add_tests", "add_docs", "add_tests"), 1)
+    ]
+    plan = OptimizationPlan(
+        project_id="test-project",
+        timestamp="2026-02-15T10:00:00",
+        findings=[],
+        actions=actions,
+        summary="Test plan"
+    )
+
+    optimizer.execute_plan(plan, ["action-1", "action-2", "action-3"])
+
+    assert [t.id for t in optimizer.state.tasks[3:]] == ["OPT-002", "OPT-004", "OPT-005"]
@@ -15,3 +15,32 @@ def test_agent_registry_get_unknown_agent_raises():
 
     with pytest.raises(ValueError, match="Unknown agent"):
         registry.get("nonexistent-agent")
+
+
+def test_agent_registry_register_and_get():
+    registry = AgentRegistry()
+    agent = object()
+    registry.register("deliverable-analyzer", agent)
+
+    assert registry.get("deliverable-analyzer") is agent
+    assert registry.list_agents() == ["deliverable-analyzer", "task-decomposer"]
+
+
+def test_agent_registry_imports_builtins_on_first_get():
+    registry = AgentRegistry()
+
+    agent = registry.get("task-decomposer")
+
+    assert type(agent).__name__ == "TaskDecomposer"
+    assert registry.get("task-decomposer") is agent
+
+
+def test_agent_registry_register_lazy():
+    registry = AgentRegistry()
+    registry.register_lazy(
+        "copy-of-analyzer",
+        "src.optimizer.agents.deliverable_analyzer:DeliverableAnalyzer",
+    )
+
+    assert "copy-of-analyzer" in registry.list_agents()
+    assert type(registry.get("copy-of-analyzer")).__name__ == "DeliverableAnalyzer"
@@ -70,3 +70,12 @@ def test_deliverable_analyzer_handles_malformed_output():
 
     assert result is not None
     assert len(result.findings) == 0  # Empty result, no crash
+
+
+def test_deliverable_analyzer_handles_non_object_output():
+    analyzer = DeliverableAnalyzer()
+
+    for output in ("5", "[]", '{"findings": "none"}', '{"findings": [1]}'):
+        result = analyzer.parse_output(output)
+        assert result.task_id == "unknown"
+        assert result.findings == []
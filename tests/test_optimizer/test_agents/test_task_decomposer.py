@@ -73,3 +73,26 @@ def test_task_decomposer_parses_valid_output():
     assert result.should_decompose is True
     assert len(result.suggested_subtasks) == 2
     assert len(result.findings) == 1
+
+
+def test_task_decomposer_handles_malformed_output():
+    decomposer = TaskDecomposer()
+
+    result = decomposer.parse_output("{ invalid json")
+
+    assert result.should_decompose is False
+    assert result.findings == []
+
+
+def test_task_decomposer_parses_bytes_output():
+    decomposer = TaskDecomposer()
+    mock_output = json.dumps({
+        "task_id": "FE-205",
+        "should_decompose": False,
+        "findings": []
+    }).encode()
+
+    result = decomposer.parse_output(mock_output)
+
+    assert result.task_id == "FE-205"
+    assert result.should_decompose is False
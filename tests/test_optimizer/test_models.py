@@ -1,3 +1,6 @@
+import dataclasses
+import json
+
 import pytest
 from pathlib import Path
 from src.optimizer.models import OptimizationFinding, OptimizationAction, OptimizationPlan
@@ -38,3 +41,63 @@ def test_optimization_finding_from_dict():
     assert finding.finding_id == "deliverable-FE-205-1"
     assert finding.task_id == "FE-205"
     assert finding.category == "test_gap"
+
+
+def test_optimization_plan_save_load_roundtrip(tmp_path):
+    finding = OptimizationFinding(
+        finding_id="deliverable-FE-205-1",
+        task_id="FE-205",
+        category="test_gap",
+        severity="high",
+        description="No unit tests found — 测试缺失",
+        evidence=["Task type is 'core' but no test files exist"],
+        suggested_action="Add unit tests for SCF convergence"
+    )
+    action = OptimizationAction(
+        action_id="action-1",
+        action_type="add_tests",
+        target_task_id="FE-205",
+        description="Add SCF tests",
+        rationale="Core task without tests",
+        addresses_findings=["deliverable-FE-205-1"],
+        estimated_effort="2h",
+        priority="high"
+    )
+    plan = OptimizationPlan(
+        project_id="f-electron-scf",
+        timestamp="2026-02-19T00:00:00",
+        findings=[finding],
+        actions=[action],
+        conflicts=["none"],
+        summary="One gap"
+    )
+
+    json_path, markdown_path = plan.save(tmp_path)
+
+    assert markdown_path.exists()
+    assert OptimizationPlan.load(json_path).to_dict() == plan.to_dict()
+    assert json.loads(json_path.read_text()) == plan.to_dict()
+
+
+@pytest.mark.parametrize("cls", [OptimizationFinding, OptimizationAction])
+def test_from_dict_field_order_matches_dataclass(cls):
+    assert cls._FIELDS == tuple(f.name for f in dataclasses.fields(cls))
+
+
+def test_plan_save_reflects_changes_made_after_a_previous_save(tmp_path):
+    plan = OptimizationPlan(
+        project_id="f-electron-scf",
+        timestamp="2026-02-19T00:00:00",
+        findings=[],
+        actions=[],
+        summary="Nothing yet"
+    )
+    plan.save(tmp_path)
+
+    plan.summary = "Updated"
+    plan.conflicts.append("Task FE-205: split before adding tests")
+    _, markdown_path = plan.save(tmp_path)
+
+    report = markdown_path.read_text()
+    assert "Updated" in report
+    assert "Task FE-205: split before adding tests" in report
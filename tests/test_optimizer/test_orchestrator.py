@@ -112,3 +112,79 @@ def test_analyze_and_plan_handles_agent_failure(test_project_dir):
     assert plan is not None
     assert len(plan.findings) == 0
     assert "No optimization opportunities" in plan.summary
+
+
+def _finding(finding_id, category, severity="medium", task_id="TEST-001"):
+    return OptimizationFinding(
+        finding_id=finding_id,
+        task_id=task_id,
+        category=category,
+        severity=severity,
+        description=f"{category} found",
+        evidence=[],
+        suggested_action=f"Fix {category}"
+    )
+
+
+def test_generate_actions_maps_categories_and_skips_unhandled(test_project_dir):
+    optimizer = ProjectOptimizer(test_project_dir)
+    findings = [
+        _finding("f-1", "scope_creep"),
+        _finding("f-2", "integration_risk"),
+        _finding("f-3", "deliverable_unclear", severity="low"),
+    ]
+
+    actions = optimizer._generate_actions(findings)
+
+    assert [(a.action_id, a.action_type, a.estimated_effort) for a in actions] == [
+        ("action-1", "split_task", "2-3 days"),
+        ("action-2", "clarify_deliverable", "1 day"),
+    ]
+    assert actions[0].description == "Decompose TEST-001 into subtasks"
+    assert actions[1].description == "Fix deliverable_unclear"
+    assert actions[1].addresses_findings == ["f-3"]
+    assert actions[1].priority == "low"
+
+
+def test_merge_findings_orders_by_severity_stably(test_project_dir):
+    optimizer = ProjectOptimizer(test_project_dir)
+    first, second = MagicMock(), MagicMock()
+    first.findings = [
+        _finding("a", "test_gap", "low"),
+        _finding("b", "doc_gap", "urgent"),
+        _finding("c", "test_gap", "critical"),
+    ]
+    second.findings = [
+        _finding("d", "scope_creep", "low"),
+        _finding("e", "doc_gap", "critical"),
+    ]
+
+    merged = optimizer._merge_findings({"one": first, "two": second, "three": None})
+
+    assert [f.finding_id for f in merged] == ["c", "e", "a", "d", "b"]
+
+
+def test_detect_conflicts_flags_scope_creep_with_deliverable_gaps(test_project_dir):
+    optimizer = ProjectOptimizer(test_project_dir)
+    findings = [
+        _finding("a", "doc_gap", task_id="T-2"),
+        _finding("b", "scope_creep", task_id="T-1"),
+        _finding("c", "scope_creep", task_id="T-2"),
+        _finding("d", "integration_risk", task_id="T-1"),
+        _finding("e", "scope_creep", task_id="T-3"),
+        _finding("f", "scope_creep", task_id="T-3"),
+    ]
+
+    conflicts = optimizer._detect_conflicts(findings)
+
+    assert len(conflicts) == 1
+    assert conflicts[0].startswith("Task T-2: Decomposition suggested")
+
+
+def test_invoke_agents_accepts_bytes_from_default_invoker(test_project_dir):
+    optimizer = ProjectOptimizer(test_project_dir)
+
+    results = optimizer._invoke_agents(["deliverable-analyzer", "task-decomposer"])
+
+    assert set(results) == {"deliverable-analyzer", "task-decomposer"}
+    assert all(result.findings == [] for result in results.values())
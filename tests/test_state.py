@@ -176,6 +176,16 @@ class TestDraft:
         }
         assert draft.explanation == "Initial solver implementation"
 
+    def test_total_lines_counts_files_and_tests(self) -> None:
+        draft = Draft(
+            task_id="T-001",
+            files={"a.py": "x = 1\ny = 2\n", "b.py": "z = 3\n"},
+            test_files={"test_a.py": "def test(): pass\n"},
+            explanation="",
+        )
+        assert draft.total_lines == 4
+        assert "_total_lines" not in draft.to_dict()
+
 
 class TestGateResult:
     def test_gate_result(self) -> None:
@@ -0,0 +1,149 @@
+import json
+import os
+from pathlib import Path
+
+from tools.build_state import build_state, load_tasks_from_file
+
+
+def _write(path: Path, data) -> None:
+    path.write_text(json.dumps(data, ensure_ascii=False))
+
+
+def test_load_tasks_from_list(tmp_path):
+    f = tmp_path / "tasks_a.json"
+    _write(f, [{"id": "T-1", "title": "One"}])
+    assert load_tasks_from_file(f) == [{"id": "T-1", "title": "One"}]
+
+
+def test_load_tasks_from_dict(tmp_path):
+    f = tmp_path / "tasks_a.json"
+    _write(f, {"phase": "x", "tasks": [{"id": "T-1"}, {"id": "T-2"}]})
+    assert [t["id"] for t in load_tasks_from_file(f)] == ["T-1", "T-2"]
+
+
+def test_build_state_statistics(tmp_path):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    _write(state_dir / "tasks_a.json", [
+        {"id": "T-1", "title": "Α", "status": "done"},
+        {"id": "T-2", "title": "B", "status": "pending"},
+    ])
+    _write(state_dir / "tasks_b.json", [
+        {"id": "T-3", "title": "C", "status": "deferred"},
+        {"id": "T-4", "title": "D"},
+    ])
+
+    assert build_state(tmp_path) is True
+
+    out = json.loads((state_dir / "project_state.json").read_text())
+    assert [t["id"] for t in out["tasks"]] == ["T-1", "T-2", "T-3", "T-4"]
+    assert out["tasks"][0]["title"] == "Α"
+    stats = out["metadata"]["statistics"]
+    assert stats["total_tasks"] == 4
+    assert stats["active_tasks"] == 3
+    assert stats["deferred_tasks"] == 1
+    assert stats["done"] == 1
+    assert stats["pending"] == 2
+
+
+def test_build_state_no_splits(tmp_path):
+    (tmp_path / "state").mkdir()
+    assert build_state(tmp_path) is False
+
+
+def test_build_state_skips_when_up_to_date(tmp_path, capsys):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    split = state_dir / "tasks_a.json"
+    _write(split, [{"id": "T-1", "title": "One", "status": "pending"}])
+    assert build_state(tmp_path) is True
+    out = state_dir / "project_state.json"
+    os.utime(split, ns=(1_000, 1_000))
+    os.utime(state_dir, ns=(1_000, 1_000))
+    os.utime(out, ns=(2_000, 2_000))
+    capsys.readouterr()
+
+    assert build_state(tmp_path) is True
+    assert "up to date" in capsys.readouterr().out
+    assert out.stat().st_mtime_ns == 2_000
+
+    os.utime(split, ns=(3_000, 3_000))
+    assert build_state(tmp_path) is True
+    assert "Built project_state.json" in capsys.readouterr().out
+
+
+def test_build_state_rebuilds_after_split_file_removed(tmp_path, capsys):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    _write(state_dir / "tasks_a.json", [{"id": "T-1", "title": "One"}])
+    stale = state_dir / "tasks_b.json"
+    _write(stale, [{"id": "T-2", "title": "Two"}])
+    assert build_state(tmp_path) is True
+    out = state_dir / "project_state.json"
+    # The remaining split is older than the output; only the removal is new
+    os.utime(state_dir / "tasks_a.json", ns=(1_000, 1_000))
+    os.utime(out, ns=(2_000, 2_000))
+    stale.unlink()
+    capsys.readouterr()
+
+    assert build_state(tmp_path) is True
+
+    assert "Built project_state.json" in capsys.readouterr().out
+    tasks = json.loads(out.read_text())["tasks"]
+    assert [t["id"] for t in tasks] == ["T-1"]
+
+
+def test_build_state_force_rebuilds(tmp_path, capsys):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    _write(state_dir / "tasks_a.json", [{"id": "T-1", "title": "One"}])
+    build_state(tmp_path)
+    capsys.readouterr()
+
+    assert build_state(tmp_path, force=True) is True
+    assert "Built project_state.json" in capsys.readouterr().out
+
+
+def test_build_state_compact_and_pretty(tmp_path):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    _write(state_dir / "tasks_a.json", [{"id": "T-1", "title": "One"}])
+    out = state_dir / "project_state.json"
+
+    build_state(tmp_path)
+    assert "\n" not in out.read_text()
+
+    build_state(tmp_path, force=True, pretty=True)
+    text = out.read_text()
+    assert '\n  "request"' in text
+    assert json.loads(text)["tasks"][0]["id"] == "T-1"
+
+
+
+def test_build_state_rebuilds_when_format_changes(tmp_path, capsys):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    _write(state_dir / "tasks_a.json", [{"id": "T-1", "title": "One"}])
+    out = state_dir / "project_state.json"
+    build_state(tmp_path)
+    assert "\n" not in out.read_text()
+    capsys.readouterr()
+
+    assert build_state(tmp_path, pretty=True) is True
+    assert "Built project_state.json" in capsys.readouterr().out
+    assert '\n  "request"' in out.read_text()
+
+    assert build_state(tmp_path, pretty=True) is True
+    assert "up to date" in capsys.readouterr().out
+
+    build_state(tmp_path)
+    assert "\n" not in out.read_text()
+
+def test_build_state_quiet(tmp_path, capsys):
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    _write(state_dir / "tasks_a.json", [{"id": "T-1", "title": "One"}])
+
+    assert build_state(tmp_path, quiet=True) is True
+    assert capsys.readouterr().out == ""
+    assert (state_dir / "project_state.json").exists()
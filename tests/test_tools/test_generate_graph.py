@@ -0,0 +1,44 @@
+from tools.generate_graph import generate_dot, iter_dot_lines
+
+
+TASKS = [
+    {"id": "T-1", "title": "Set up build", "status": "done"},
+    {
+        "id": "T-2",
+        "title": "A very long task title that will be truncated",
+        "status": "in_progress",
+        "risk_level": "high",
+        "dependencies": ["T-1"],
+        "suspended_dependencies": ["T-3"],
+    },
+]
+
+
+def test_generate_dot_nodes_and_edges():
+    dot = generate_dot(TASKS, "Demo")
+    assert dot.startswith("digraph Dependencies {\n")
+    assert dot.endswith("}\n")
+    assert 'label="Demo Dependency Graph";' in dot
+    assert '"T-1" [label="T-1\\nSet up build", fillcolor="#2ecc71"' in dot
+    assert "A very long task title that wi..." in dot
+    assert "penwidth=3" in dot
+    assert '  "T-1" -> "T-2";' in dot
+    assert '  "T-3" -> "T-2" [style=dashed, color=gray];' in dot
+
+
+def test_iter_dot_lines_are_newline_terminated():
+    lines = list(iter_dot_lines(TASKS))
+    assert all(line.endswith("\n") for line in lines)
+    assert "".join(lines) == generate_dot(TASKS)
+
+
+def test_generate_dot_escapes_quotes_and_backslashes():
+    tasks = [{"id": 'T-"1"', "title": 'Say "hi"\\now', "dependencies": ['T-"0"']}]
+    dot = generate_dot(tasks)
+    assert '"T-\\"1\\"" [label="T-\\"1\\"\\nSay \\"hi\\"\\\\now"' in dot
+    assert '  "T-\\"0\\"" -> "T-\\"1\\"";' in dot
+
+
+def test_generate_dot_escapes_project_name():
+    dot = generate_dot(TASKS, 'My "SCF"\\core')
+    assert 'label="My \\"SCF\\"\\\\core Dependency Graph";' in dot
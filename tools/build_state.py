@@ -7,20 +7,56 @@ project_state_meta.json, and outputs state/project_state.json.
 Usage:
     python -m tools.build_state projects/f-electron-scf
     python -m tools.build_state --all
+    python -m tools.build_state --all --force   # rebuild even if up to date
+    python -m tools.build_state --all --pretty  # indented, human-readable output
+    python -m tools.build_state --all --quiet   # no per-file/status report
 """
 
 from __future__ import annotations
 
 import json
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from tools.state_loader import find_project_dirs
 
 
+def _loads(raw: bytes) -> object:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, obj: object, pretty: bool = False) -> None:
+    """Write obj as UTF-8 JSON without an intermediate str copy.
+
+    Output is compact unless pretty is set, since the dashboard is the
+    main consumer.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        path.write_bytes(orjson.dumps(obj, option=option))
+        return
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if pretty:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+
+
 def load_tasks_from_file(file_path: Path) -> list[dict]:
     """Load tasks from a JSON file, handling both list and dict formats."""
-    data = json.loads(file_path.read_text())
+    data = _loads(file_path.read_bytes())
     if isinstance(data, list):
         return data
     tasks = []
@@ -30,10 +66,46 @@ def load_tasks_from_file(file_path: Path) -> list[dict]:
     return tasks
 
 
-def build_state(project_dir: Path) -> bool:
+def _mtime_ns(path: Path) -> int:
+    """Return the mtime of path in ns, or 0 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _is_up_to_date(out: Path, inputs: list[Path]) -> bool:
+    """Return True if out is newer than every existing input path.
+
+    Pass the containing directory as an input too: its mtime moves when
+    an input file is deleted or renamed, which no file mtime records.
+    """
+    out_mtime = _mtime_ns(out)
+    if not out_mtime:
+        return False
+    return out_mtime >= max(map(_mtime_ns, inputs), default=0)
+
+
+def _is_pretty(path: Path) -> bool:
+    """Return True if the JSON at path was written indented."""
+    with open(path, "rb") as f:
+        return f.read(2) == b"{\n"
+
+
+def build_state(
+    project_dir: Path,
+    force: bool = False,
+    pretty: bool = False,
+    quiet: bool = False,
+) -> bool:
     """Build project_state.json from split files in state/ directory.
 
-    Returns True if state was built, False if no split files found.
+    Skips the rebuild when project_state.json is newer than all of its
+    inputs and already in the requested format, unless force is set. The output is compact JSON unless pretty
+    is set. quiet suppresses the per-file and status summary report.
+
+    Returns True if state was built (or already current), False if no
+    split files found.
     """
     state_dir = project_dir / "state"
     if not state_dir.exists():
@@ -44,23 +116,32 @@ def build_state(project_dir: Path) -> bool:
     if not split_files:
         return False
 
-    # Load all tasks from splits
+    out = state_dir / "project_state.json"
+    meta_path = state_dir / "project_state_meta.json"
+    inputs = [state_dir, *split_files, meta_path, project_dir / "project.json"]
+    if not force and _is_up_to_date(out, inputs) and _is_pretty(out) == pretty:
+        if not quiet:
+            print("  project_state.json is up to date")
+        return True
+
+    # Load all tasks from splits; reads overlap across files, order is kept
+    with ThreadPoolExecutor(max_workers=min(8, len(split_files))) as ex:
+        loaded = list(ex.map(load_tasks_from_file, split_files))
+
     all_tasks: list[dict] = []
-    for fpath in split_files:
-        tasks = load_tasks_from_file(fpath)
+    report: list[str] = []
+    for fpath, tasks in zip(split_files, loaded):
         all_tasks.extend(tasks)
-        print(f"  {fpath.name}: {len(tasks)} tasks")
+        report.append(f"  {fpath.name}: {len(tasks)} tasks\n")
 
     # Load metadata if available
-    meta_path = state_dir / "project_state_meta.json"
-    if meta_path.exists():
-        meta = json.loads(meta_path.read_text())
-    else:
+    try:
+        meta = _loads(meta_path.read_bytes())
+    except FileNotFoundError:
         # Build minimal metadata from project.json
-        proj_path = project_dir / "project.json"
-        if proj_path.exists():
-            proj = json.loads(proj_path.read_text())
-        else:
+        try:
+            proj = _loads((project_dir / "project.json").read_bytes())
+        except FileNotFoundError:
             proj = {"project_id": project_dir.name}
         meta = {
             "request": proj.get("request", ""),
@@ -91,45 +172,45 @@ def build_state(project_dir: Path) -> bool:
 
     # Update statistics
     stats = state.setdefault("metadata", {}).setdefault("statistics", {})
+    counts = Counter(t.get("status", "pending") for t in all_tasks)
     stats["total_tasks"] = len(all_tasks)
-    stats["active_tasks"] = sum(
-        1 for t in all_tasks if t.get("status") != "deferred"
-    )
-    stats["deferred_tasks"] = sum(
-        1 for t in all_tasks if t.get("status") == "deferred"
-    )
-    stats["in_review"] = sum(
-        1 for t in all_tasks if t.get("status") == "in_review"
-    )
-    stats["in_progress"] = sum(
-        1 for t in all_tasks if t.get("status") == "in_progress"
-    )
-    stats["done"] = sum(
-        1 for t in all_tasks if t.get("status") == "done"
-    )
-    stats["pending"] = sum(
-        1 for t in all_tasks if t.get("status") == "pending"
-    )
+    stats["active_tasks"] = len(all_tasks) - counts["deferred"]
+    stats["deferred_tasks"] = counts["deferred"]
+    stats["in_review"] = counts["in_review"]
+    stats["in_progress"] = counts["in_progress"]
+    stats["done"] = counts["done"]
+    stats["pending"] = counts["pending"]
 
     # Write output
-    out = state_dir / "project_state.json"
-    out.write_text(json.dumps(state, ensure_ascii=False, indent=2))
-
-    print(f"\n  Built project_state.json: {len(all_tasks)} tasks")
-    print(
-        f"  pending={stats['pending']}  in_review={stats['in_review']}  "
-        f"in_progress={stats['in_progress']}  done={stats['done']}  "
-        f"deferred={stats['deferred_tasks']}"
-    )
+    _write_json(out, state, pretty=pretty)
+
+    if not quiet:
+        report.append(f"\n  Built project_state.json: {len(all_tasks)} tasks\n")
+        report.append(
+            f"  pending={stats['pending']}  in_review={stats['in_review']}  "
+            f"in_progress={stats['in_progress']}  done={stats['done']}  "
+            f"deferred={stats['deferred_tasks']}\n"
+        )
+        sys.stdout.write("".join(report))
     return True
 
 
 def main() -> None:
     args = sys.argv[1:]
+    flags = {a for a in args if a in ("--force", "--pretty", "--quiet")}
+    args = [a for a in args if a not in flags]
+    opts = {
+        "force": "--force" in flags,
+        "pretty": "--pretty" in flags,
+        "quiet": "--quiet" in flags,
+    }
 
     if not args or args[0] == "--help":
-        print("Usage: python -m tools.build_state <project_dir>")
-        print("       python -m tools.build_state --all")
+        print(
+            "Usage: python -m tools.build_state <project_dir> "
+            "[--force] [--pretty] [--quiet]"
+        )
+        print("       python -m tools.build_state --all [--force] [--pretty] [--quiet]")
         sys.exit(0)
 
     if args[0] == "--all":
@@ -139,7 +220,7 @@ def main() -> None:
             sys.exit(1)
         for d in dirs:
             print(f"\n=== {d.name} ===")
-            if not build_state(d):
+            if not build_state(d, **opts):
                 print("  No split files found, skipping")
     else:
         project_dir = Path(args[0])
@@ -147,7 +228,7 @@ def main() -> None:
             print(f"Project directory not found: {project_dir}")
             sys.exit(1)
         print(f"=== {project_dir.name} ===")
-        if not build_state(project_dir):
+        if not build_state(project_dir, **opts):
             print("  No split files found")
 
 
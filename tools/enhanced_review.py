@@ -7,6 +7,7 @@ Phase 3: Generate enhanced recommendations based on literature
 """
 
 import json
+from collections import Counter
 from pathlib import Path
 import sys
 
@@ -147,10 +148,11 @@ def enhance_with_literature(basic_result: dict, lit_results: dict) -> dict:
             review['key_papers'] = lit.key_papers
 
     # Add literature summary to metadata
+    novelty_counts = Counter(r.novelty_level for r in lit_results.values())
     enhanced['literature_summary'] = {
         'reviewed_tasks': len(lit_results),
-        'frontier_tasks': sum(1 for r in lit_results.values() if r.novelty_level == 'frontier'),
-        'advanced_tasks': sum(1 for r in lit_results.values() if r.novelty_level == 'advanced'),
+        'frontier_tasks': novelty_counts['frontier'],
+        'advanced_tasks': novelty_counts['advanced'],
     }
 
     return enhanced
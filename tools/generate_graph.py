@@ -13,65 +13,75 @@ from __future__ import annotations
 import shutil
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from tools.state_loader import find_project_dirs, load_state
 
+_COLOR_MAP = {
+    "pending": "#3498db",
+    "in_progress": "#f39c12",
+    "in_review": "#9b59b6",
+    "done": "#2ecc71",
+    "failed": "#e74c3c",
+    "deferred": "#95a5a6",
+}
+
+_BORDER_MAP = {"low": "1", "medium": "2", "high": "3"}
+
+# Characters that would break out of a quoted DOT string
+_DOT_ESCAPE = str.maketrans({'"': '\\"', "\\": "\\\\", "\n": "\\n"})
 
-def generate_dot(tasks: list[dict], project_name: str = "") -> str:
-    """Generate DOT format string from normalized task list."""
-    lines = [
-        "digraph Dependencies {",
-        "  rankdir=LR;",
-        "  node [shape=box, style=rounded, fontsize=11];",
-        f'  label="{project_name} Dependency Graph";' if project_name else "",
-        "",
-    ]
-
-    color_map = {
-        "pending": "#3498db",
-        "in_progress": "#f39c12",
-        "in_review": "#9b59b6",
-        "done": "#2ecc71",
-        "failed": "#e74c3c",
-        "deferred": "#95a5a6",
-    }
-
-    border_map = {"low": "1", "medium": "2", "high": "3"}
 
+def iter_dot_lines(tasks: list[dict], project_name: str = "") -> Iterator[str]:
+    """Yield newline-terminated DOT lines for a normalized task list."""
+    yield "digraph Dependencies {\n"
+    yield "  rankdir=LR;\n"
+    yield "  node [shape=box, style=rounded, fontsize=11];\n"
+    if project_name:
+        yield f'  label="{project_name.translate(_DOT_ESCAPE)} Dependency Graph";\n'
+    else:
+        yield "\n"
+    yield "\n"
+
+    color_get = _COLOR_MAP.get
+    border_get = _BORDER_MAP.get
+    edge_lines: list[str] = []
+
+    # Emit nodes and collect edges in a single pass over the tasks
     for task in tasks:
-        tid = task["id"]
+        tid = task["id"].translate(_DOT_ESCAPE)
         title = task["title"]
         if len(title) > 30:
             title = title[:30] + "..."
-        # Escape quotes for DOT
-        title = title.replace('"', '\\"')
-
-        status = task.get("status", "pending")
-        risk = task.get("risk_level", "low")
-        color = color_map.get(status, "#3498db")
-        border = border_map.get(risk, "1")
-
-        label = f"{tid}\\n{title}"
-        lines.append(
-            f'  "{tid}" [label="{label}", fillcolor="{color}", '
-            f'style="filled,rounded", penwidth={border}];'
-        )
+        title = title.translate(_DOT_ESCAPE)
 
-    lines.append("")
+        color = color_get(task.get("status", "pending"), "#3498db")
+        border = border_get(task.get("risk_level", "low"), "1")
 
-    # Edges from dependencies
-    for task in tasks:
-        tid = task["id"]
+        yield (
+            f'  "{tid}" [label="{tid}\\n{title}", fillcolor="{color}", '
+            f'style="filled,rounded", penwidth={border}];\n'
+        )
+
+        # Edges from dependencies
         for dep in task.get("dependencies", []):
-            lines.append(f'  "{dep}" -> "{tid}";')
+            dep = dep.translate(_DOT_ESCAPE)
+            edge_lines.append(f'  "{dep}" -> "{tid}";\n')
 
         # Suspended dependencies as dashed lines
         for dep in task.get("suspended_dependencies", []):
-            lines.append(f'  "{dep}" -> "{tid}" [style=dashed, color=gray];')
+            dep = dep.translate(_DOT_ESCAPE)
+            edge_lines.append(f'  "{dep}" -> "{tid}" [style=dashed, color=gray];\n')
+
+    yield "\n"
+    yield from edge_lines
+    yield "}\n"
 
-    lines.append("}")
-    return "\n".join(lines)
+
+def generate_dot(tasks: list[dict], project_name: str = "") -> str:
+    """Generate DOT format string from normalized task list."""
+    return "".join(iter_dot_lines(tasks, project_name))
 
 
 def generate_graph(project_dir: Path) -> bool:
@@ -85,11 +95,10 @@ def generate_graph(project_dir: Path) -> bool:
     if not tasks:
         return False
 
-    dot_content = generate_dot(tasks, state["name"])
-
-    # Write DOT file
+    # Stream the DOT file rather than materializing it first
     dot_path = project_dir / "dependency_graph.dot"
-    dot_path.write_text(dot_content)
+    with open(dot_path, "w", buffering=1 << 16) as f:
+        f.writelines(iter_dot_lines(tasks, state["name"]))
     print(f"  Generated: {dot_path}")
 
     # Try to generate SVG if graphviz is available
@@ -15,6 +15,9 @@ from pathlib import Path
 from tools.state_loader import load_state
 from src.velocity import compute_velocity, forecast_completion
 
+# Active statuses that count as "remaining" in the closure report
+_REMAINING_STATUS = {"in_progress": "pending", "in_review": "pending"}
+
 
 def _load_meta(project_dir: Path) -> dict:
     """Load project metadata from project_state_meta.json or project_state.json."""
@@ -131,11 +134,19 @@ def generate_closure(project_dir: Path) -> Path:
 
     # Compute metrics
     total = len(tasks)
-    done = [t for t in tasks if t.get("status") in ("done",)]
-    terminated = [t for t in tasks if t.get("status") == "terminated"]
-    deferred = [t for t in tasks if t.get("status") == "deferred"]
-    failed = [t for t in tasks if t.get("status") == "failed"]
-    pending = [t for t in tasks if t.get("status") in ("pending", "in_progress", "in_review")]
+    buckets: dict[str, list[dict]] = {
+        "done": [], "terminated": [], "deferred": [], "failed": [], "pending": [],
+    }
+    for t in tasks:
+        status = t.get("status")
+        bucket = buckets.get(_REMAINING_STATUS.get(status, status))
+        if bucket is not None:
+            bucket.append(t)
+    done = buckets["done"]
+    terminated = buckets["terminated"]
+    deferred = buckets["deferred"]
+    failed = buckets["failed"]
+    pending = buckets["pending"]
 
     vel = compute_velocity(tasks, window_weeks=4)
 